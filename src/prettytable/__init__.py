@@ -24,6 +24,10 @@ from .prettytable import (
     from_html,
     from_html_one,
     from_json,
+    from_numpy,
+    from_sequence,
+    set_width_cache_size,
+    width_cache_info,
 )
 
 __all__ = [
@@ -49,5 +53,9 @@ __all__ = [
     "from_html",
     "from_html_one",
     "from_json",
+    "from_numpy",
+    "from_sequence",
+    "set_width_cache_size",
+    "width_cache_info",
     "__version__",
 ]
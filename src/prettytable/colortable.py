@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from .prettytable import PrettyTable
 
 try:
@@ -135,5 +137,10 @@ class ColorTable(PrettyTable):
             + theme.default_color
         )
 
-    def get_string(self, **kwargs) -> str:
-        return super().get_string(**kwargs) + RESET_CODE
+    def iter_lines(self, **kwargs) -> Iterator[str]:
+        lines = super().iter_lines(**kwargs)
+        line = next(lines, "")
+        for next_line in lines:
+            yield line
+            line = next_line
+        yield line + RESET_CODE
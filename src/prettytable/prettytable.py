@@ -33,14 +33,30 @@
 
 from __future__ import annotations
 
+import datetime as dt
+import functools
+import heapq
 import io
 import re
-from collections.abc import Callable, Iterable, Sequence
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from decimal import Decimal
 from enum import IntEnum
 from html.parser import HTMLParser
-from typing import TYPE_CHECKING, Any, Final, Literal
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Final, Literal, overload
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
     from sqlite3 import Cursor
 
     from _typeshed import SupportsRichComparison
@@ -88,7 +104,13 @@ RANDOM: Final = TableStyle.RANDOM
 
 BASE_ALIGN_VALUE: Final = "base_align_value"
 
+# Number of rows handed to each task of a format_executor. Tables with fewer rows
+# than this to format are formatted in the calling thread.
+FORMAT_CHUNK_SIZE: Final = 256
+
 RowType: TypeAlias = list[Any]
+SortByType: TypeAlias = "str | Sequence[str | tuple[str, bool]]"
+RowFilterType: TypeAlias = "Callable[[RowType], bool] | Mapping[str, Any]"
 AlignType: TypeAlias = Literal["l", "c", "r"]
 VAlignType: TypeAlias = Literal["t", "m", "b"]
 HeaderStyleType: TypeAlias = Literal["cap", "title", "upper", "lower", None]
@@ -97,12 +119,599 @@ _re = re.compile(r"\033\[[0-9;]*m|\033\(B")
 
 
 def _get_size(text: str) -> tuple[int, int]:
+    if text.isascii() and text.isprintable():
+        # A single line of plain ASCII, no need to split or measure it
+        return len(text), 1
     lines = text.split("\n")
     height = len(lines)
     width = max(_str_block_width(line) for line in lines)
     return width, height
 
 
+def _format_value(
+    field: str,
+    value: Any,
+    int_format: dict[str, str],
+    float_format: dict[str, str],
+    custom_format: dict[str, Callable[[str, Any], str]],
+) -> str:
+    if isinstance(value, int) and field in int_format:
+        return (f"%{int_format[field]}d") % value
+    elif isinstance(value, float) and field in float_format:
+        return (f"%{float_format[field]}f") % value
+
+    formatter = custom_format.get(field, (lambda f, v: str(v)))
+    return formatter(field, value)
+
+
+def _format_with(fmt: str, fallback: Callable[[Any], str]) -> Callable[[Any], str]:
+    """Return a function applying a printf style format to values of a column of
+    one type, and fallback to missing values"""
+
+    def format_value(value: Any) -> str:
+        return fallback(value) if value is None else fmt % value
+
+    return format_value
+
+
+def _memoized(function: Callable[[str], str]) -> Callable[[str], str]:
+    """Return function wrapped to work out its result for each string only once"""
+    results: dict[str, str] = {}
+
+    def memoized(text: str) -> str:
+        result = results.get(text)
+        if result is None:
+            result = results[text] = function(text)
+        return result
+
+    return memoized
+
+
+def _to_int(value: Any) -> int:
+    result = int(value)
+    # Don't drop the fraction of numbers that aren't whole
+    if isinstance(value, (float, Decimal)) and result != value:
+        msg = f"Can't convert {value!r} to int"
+        raise ValueError(msg)
+    return result
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in ("true", "yes", "1"):
+            return True
+        if text in ("false", "no", "0"):
+            return False
+        msg = f"Can't convert {value!r} to bool"
+        raise ValueError(msg)
+    return bool(value)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    # Go through the shortest repr of floats, not their exact binary value
+    return Decimal(str(value) if isinstance(value, float) else value)
+
+
+def _to_date(value: Any) -> dt.date:
+    if isinstance(value, dt.datetime):
+        return value.date()
+    return dt.date.fromisoformat(value)
+
+
+# The types a column can be declared as, with the function converting values to each
+_CONVERTERS: Final[dict[type, Callable[[Any], Any]]] = {
+    int: _to_int,
+    float: float,
+    str: str,
+    bool: _to_bool,
+    Decimal: _to_decimal,
+    dt.date: _to_date,
+    dt.datetime: dt.datetime.fromisoformat,
+}
+
+
+def _convert_value(column_type: type, value: Any) -> Any:
+    """Return value as an instance of column_type. Missing values, None or the
+    empty strings that CSV files have in their place, become None."""
+    if value is None or type(value) is column_type:
+        return value
+    if isinstance(value, str) and not value and column_type is not str:
+        return None
+    try:
+        return _CONVERTERS[column_type](value)
+    except (ValueError, TypeError, ArithmeticError):
+        msg = f"Can't convert {value!r} to {column_type.__name__}"
+        raise ValueError(msg)
+
+
+def _infer_type(values: Iterable[Any]) -> type | None:
+    """Return the type of column that the given values fit, or None if there are
+    no values or they are of different types. Strings are converted to the first
+    type that all of them can be converted to."""
+    present = [
+        v for v in values if v is not None and not (isinstance(v, str) and not v)
+    ]
+    kinds = {type(v) for v in present}
+    if kinds == {str}:
+        for candidate in (int, float, bool, dt.date, dt.datetime):
+            try:
+                for value in present:
+                    _CONVERTERS[candidate](value)
+            except (ValueError, TypeError, ArithmeticError):
+                continue
+            return candidate
+        return str
+    if len(kinds) == 1 and (kind := kinds.pop()) in _CONVERTERS:
+        return kind
+    return None
+
+
+def _default_sort_key(row: RowType) -> SupportsRichComparison:
+    return row
+
+
+def _sort_fields(sortby: SortByType) -> str | tuple[tuple[str, bool], ...]:
+    """Return a single sortby field name as it is, or a sequence of field names as
+    (field name, reverse) pairs"""
+    if isinstance(sortby, str):
+        return sortby
+    return tuple(
+        (field, False) if isinstance(field, str) else (field[0], bool(field[1]))
+        for field in sortby
+    )
+
+
+class _Reversed:
+    """Wrap a sort key so that it sorts in descending order"""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any) -> None:
+        self.key = key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Reversed) and self.key == other.key
+
+    def __lt__(self, other: _Reversed) -> bool:
+        return other.key < self.key
+
+
+def _format_chunk(
+    field_names: list[str],
+    int_format: dict[str, str],
+    float_format: dict[str, str],
+    custom_format: dict[str, Callable[[str, Any], str]],
+    rows: list[RowType],
+) -> list[list[str]]:
+    return [
+        [
+            _format_value(field, value, int_format, float_format, custom_format)
+            for (field, value) in zip(field_names, row)
+        ]
+        for row in rows
+    ]
+
+
+def _write_lines(fp, lines: Iterable[str], linebreak: str) -> None:
+    """Write lines to fp with linebreak between them, like fp.write(linebreak.join(
+    lines)) but without holding them all in memory."""
+    for i, line in enumerate(lines):
+        if i:
+            fp.write(linebreak)
+        fp.write(line)
+
+
+# Options that the pieces precomputed in a _RenderLayout depend on
+_LAYOUT_OPTIONS: Final = (
+    "fields",
+    "border",
+    "preserve_internal_border",
+    "hrules",
+    "vrules",
+    "padding_width",
+    "left_padding_width",
+    "right_padding_width",
+    "vertical_char",
+    "horizontal_char",
+    "junction_char",
+    "top_junction_char",
+    "bottom_junction_char",
+    "right_junction_char",
+    "left_junction_char",
+    "top_right_junction_char",
+    "top_left_junction_char",
+    "bottom_right_junction_char",
+    "bottom_left_junction_char",
+)
+
+
+class _RenderLayout:
+    """The parts of the plain text rendering of a table that are the same for every
+    row: horizontal rules, padding, border characters and the position, width and
+    alignment of each printed column.
+
+    A layout is compiled from the resolved options and column widths of a render,
+    and reused by later renders for as long as those stay the same."""
+
+    def __init__(self, table: PrettyTable, options, key: tuple) -> None:
+        self.key = key
+        self.hrule = table._stringify_hrule(options)
+        self.top_hrule = table._stringify_hrule(options, where="top_")
+        self.bottom_hrule = table._stringify_hrule(options, where="bottom_")
+
+        lpad, rpad = table._get_padding_widths(options)
+        self.lpad = " " * lpad
+        self.rpad = " " * rpad
+
+        # (index, field, width, align, valign) of each column to print
+        self.columns = [
+            (index, field, width, table._align[field], table._valign[field])
+            for index, (field, width) in enumerate(
+                zip(table._field_names, table._widths)
+            )
+            if not options["fields"] or field in options["fields"]
+        ]
+
+        border = options["border"]
+        vrules = options["vrules"]
+        if not border:
+            self.start = ""
+        elif vrules in (VRuleStyle.ALL, VRuleStyle.FRAME):
+            self.start = table.vertical_char
+        else:
+            self.start = " "
+        if not border and not options["preserve_internal_border"]:
+            self.separator = ""
+        elif vrules == VRuleStyle.ALL:
+            self.separator = table.vertical_char
+        else:
+            self.separator = " "
+        # With vrules FRAME, the space after the last column is really a border
+        if border and vrules == VRuleStyle.FRAME:
+            self.end = options["vertical_char"]
+        else:
+            self.end = self.separator
+        # With only an internal border, there is no border after the last column
+        if not border and options["preserve_internal_border"]:
+            self.last_end = " "
+        else:
+            self.last_end = self.end
+        self.hrule_after_row = border and options["hrules"] == HRuleStyle.ALL
+
+
+def _is_array(values: Any) -> bool:
+    """Whether values is a one-dimensional NumPy array, or something like one"""
+    return getattr(values, "ndim", None) == 1 and hasattr(values, "tolist")
+
+
+class _CategoryColumn:
+    """A column of a _ColumnStore with few distinct values, which are each kept
+    once. The column itself only holds the index of the value of each row among
+    them, its code."""
+
+    def __init__(self, values: Iterable[Any] = ()) -> None:
+        self.categories: list[Any] = []
+        self._codes: dict[tuple[type, Any], int] = {}
+        self.codes = array("I")
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.categories[self.codes[index]]
+
+    def __delitem__(self, index: int | slice) -> None:
+        del self.codes[index]
+
+    def _encode(self, value: Any) -> int:
+        # Keep values that compare equal but print differently, like 1, 1.0 and
+        # True, apart. Unhashable values are told apart by identity instead.
+        try:
+            key = (type(value), value)
+            code = self._codes.get(key)
+        except TypeError:
+            key = (type(value), id(value))
+            code = self._codes.get(key)
+        if code is None:
+            code = self._codes[key] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+    def append(self, value: Any) -> None:
+        self.codes.append(self._encode(value))
+
+    def extend(self, values: Iterable[Any]) -> None:
+        self.codes.extend([self._encode(value) for value in values])
+
+    def gather(self, indices: Sequence[int]) -> list[Any]:
+        categories = self.categories
+        codes = self.codes
+        return [categories[codes[i]] for i in indices]
+
+    def format(
+        self, formatter: Callable[[Any], str], indices: Sequence[int]
+    ) -> list[str]:
+        """Return the values at the given indices formatted with formatter, which
+        is called once for each distinct value"""
+        formatted: list[str | None] = [None] * len(self.categories)
+        result = []
+        for i in indices:
+            code = self.codes[i]
+            text = formatted[code]
+            if text is None:
+                text = formatted[code] = formatter(self.categories[code])
+            result.append(text)
+        return result
+
+    def copy(self) -> _CategoryColumn:
+        new = _CategoryColumn()
+        new.categories = self.categories[:]
+        new._codes = self._codes.copy()
+        new.codes = array("I", self.codes)
+        return new
+
+
+class _ColumnStore:
+    """The data rows of a table, stored as one list of values per column.
+
+    Behaves like the list of rows that PrettyTable keeps by default, as far as the
+    table uses it, but rows are built from the columns when they are asked for, so
+    they are always new lists. Adding and deleting whole columns does not touch
+    every row.
+
+    A column can also be a one-dimensional NumPy array, which is kept as it is
+    until rows are added or deleted. Values are taken out of arrays as Python
+    scalars, just as if the array had been converted with tolist(). Or it can be a
+    _CategoryColumn, which the table puts in place of the columns it encodes.
+
+    Deleting the first row only moves the start of the rows, so that evicting the
+    oldest rows takes constant time. The columns keep the values of the first
+    _start rows, which are deleted once they outnumber the rows left, and
+    positions() gives where rows are in the columns."""
+
+    def __init__(
+        self, rows: Iterable[RowType] = (), columns: Sequence[Any] | None = None
+    ) -> None:
+        self.columns: list[Any] = []
+        self._length = 0
+        self._start = 0
+        if columns:
+            self.columns = [
+                column if _is_array(column) else list(column) for column in columns
+            ]
+            self._length = len(columns[0])
+        self.extend(rows)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> RowType: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[RowType]: ...
+
+    def __getitem__(self, index: int | slice) -> RowType | list[RowType]:
+        if isinstance(index, slice):
+            return self.take(range(self._length)[index])
+        if not -self._length <= index < self._length:
+            msg = "row index out of range"
+            raise IndexError(msg)
+        if index < 0:
+            index += self._length
+        index += self._start
+        # Arrays give their values as tolist() does, whatever their dtype
+        return [
+            (
+                column[index]
+                if isinstance(column, (list, _CategoryColumn))
+                else column[index : index + 1].tolist()[0]
+            )
+            for column in self.columns
+        ]
+
+    def __delitem__(self, index: int) -> None:
+        if not -self._length <= index < self._length:
+            msg = "row index out of range"
+            raise IndexError(msg)
+        if index < 0:
+            index += self._length
+        self._to_lists()
+        self._length -= 1
+        if index:
+            for column in self.columns:
+                del column[index + self._start]
+            return
+        self._start += 1
+        if self._start > self._length:
+            self._compact()
+
+    def __iter__(self) -> Iterator[RowType]:
+        return iter(self.take(range(self._length)))
+
+    def positions(self, indices: Sequence[int]) -> Sequence[int]:
+        """Return where the rows at the given indices are in the columns"""
+        if not self._start:
+            return indices
+        if isinstance(indices, range):
+            return range(
+                indices.start + self._start, indices.stop + self._start, indices.step
+            )
+        return [index + self._start for index in indices]
+
+    def take(self, indices: Iterable[int]) -> list[RowType]:
+        """Return the rows at the given indices, gathering a column at a time"""
+        if not isinstance(indices, Sequence):
+            indices = list(indices)
+        if not self.columns:
+            return [[] for _ in indices]
+        positions = self.positions(indices)
+        return [
+            list(row)
+            for row in zip(*[self.gather(column, positions) for column in self.columns])
+        ]
+
+    @staticmethod
+    def gather(column: Any, indices: Sequence[int]) -> list[Any]:
+        """Return the values at the given positions of one of the columns"""
+        if isinstance(column, list):
+            return [column[i] for i in indices]
+        if isinstance(column, _CategoryColumn):
+            return column.gather(indices)
+        return column[list(indices)].tolist()
+
+    def append(self, row: RowType) -> None:
+        if not self._length and len(self.columns) != len(row):
+            self.columns = [[] for _ in row]
+            self._start = 0
+        self._to_lists()
+        for column, value in zip(self.columns, row):
+            column.append(value)
+        self._length += 1
+
+    def extend(self, rows: Iterable[RowType]) -> None:
+        if not isinstance(rows, Sequence):
+            rows = list(rows)
+        if not rows:
+            return
+        if not self._length and len(self.columns) != len(rows[0]):
+            self.columns = [[] for _ in rows[0]]
+            self._start = 0
+        self._to_lists()
+        for i, column in enumerate(self.columns):
+            column.extend([row[i] for row in rows])
+        self._length += len(rows)
+
+    def insert_column(self, index: int, values: Sequence[Any]) -> None:
+        self._compact()
+        if not self._length and len(values):
+            # Like a list of empty rows, give the other columns empty values
+            self.columns = [[None] * len(values) for _ in self.columns]
+            self._length = len(values)
+        self.columns.insert(index, values if _is_array(values) else list(values))
+
+    def del_column(self, index: int) -> None:
+        if index < len(self.columns):
+            del self.columns[index]
+
+    def copy(self) -> _ColumnStore:
+        new = _ColumnStore()
+        for column in self.columns:
+            if isinstance(column, list):
+                new.columns.append(column[:])
+            elif isinstance(column, _CategoryColumn):
+                new.columns.append(column.copy())
+            else:
+                # Arrays are never changed in place
+                new.columns.append(column)
+        new._length = self._length
+        new._start = self._start
+        return new
+
+    def _compact(self) -> None:
+        """Delete the values of the rows before _start from the columns"""
+        if self._start:
+            for column in self.columns:
+                del column[: self._start]
+            self._start = 0
+
+    def _to_lists(self) -> None:
+        # Arrays can't grow or shrink in place, so rows can only be added or
+        # deleted once they are lists
+        self.columns = [
+            column.tolist() if _is_array(column) else column for column in self.columns
+        ]
+
+
+class _RowCache:
+    """Values kept for each row of a table between renders, such as their
+    formatted values. Like _ColumnStore, deleting the first values only moves the
+    start of the list, so that evicting the oldest rows takes constant time."""
+
+    def __init__(self, values: Iterable[Any] = ()) -> None:
+        self._values = list(values)
+        self._start = 0
+
+    def __len__(self) -> int:
+        return len(self._values) - self._start
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += len(self)
+        return self._values[index + self._start]
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        if index < 0:
+            index += len(self)
+        self._values[index + self._start] = value
+
+    def __delitem__(self, index: slice) -> None:
+        start, stop, _ = index.indices(len(self))
+        if start:
+            del self._values[start + self._start : stop + self._start]
+            return
+        self._start += stop
+        if self._start > len(self):
+            del self._values[: self._start]
+            self._start = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        return islice(self._values, self._start, None)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _RowCache) and list(self) == list(other)
+
+    def __copy__(self) -> _RowCache:
+        return _RowCache(self)
+
+    def append(self, value: Any) -> None:
+        self._values.append(value)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        self._values.extend(values)
+
+
+class _RowSlice:
+    """Some of the rows of another table, picked out by their indices. Rows are
+    only read from the other table when they are asked for.
+
+    owner is the table whose own rows are read, if any, which has to copy them
+    before changing them while the slice is still in use."""
+
+    rows: Sequence[RowType] | _RowSlice
+    indices: Sequence[int]
+    owner: PrettyTable | None
+
+    def __init__(
+        self,
+        rows: Sequence[RowType] | _RowSlice,
+        indices: Sequence[int],
+        owner: PrettyTable | None,
+    ) -> None:
+        if isinstance(rows, _RowSlice):
+            # Pick straight from the original rows rather than going through both
+            indices = [rows.indices[i] for i in indices]
+            owner = rows.owner
+            rows = rows.rows
+        self.rows = rows
+        self.indices = indices
+        self.owner = owner
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, index: int) -> RowType:
+        return self.rows[self.indices[index]]
+
+    def __deepcopy__(self, memo: dict) -> list[RowType]:
+        # A deep copy only needs the rows picked out, not the table they came from
+        import copy
+
+        return [copy.deepcopy(self.rows[index], memo) for index in self.indices]
+
+
 class PrettyTable:
     _xhtml: bool
     _align: dict[str, AlignType]
@@ -115,7 +724,7 @@ class PrettyTable:
     _title: str | None
     _start: int
     _end: int | None
-    _sortby: str | None
+    _sortby: SortByType | None
     _reversesort: bool
     _sort_key: Callable[[RowType], SupportsRichComparison]
     _header: bool
@@ -127,6 +736,7 @@ class PrettyTable:
     _int_format: dict[str, str]
     _float_format: dict[str, str]
     _custom_format: dict[str, Callable[[str, Any], str]]
+    _column_types: dict[str, type]
     _padding_width: int
     _left_padding_width: int | None
     _right_padding_width: int | None
@@ -145,6 +755,9 @@ class PrettyTable:
     _format: bool
     _print_empty: bool
     _oldsortslice: bool
+    _width_estimate: int | None
+    _format_executor: Executor | None
+    _row_filter: RowFilterType | None
     _attributes: dict[str, str]
     _escape_header: bool
     _escape_data: bool
@@ -202,19 +815,76 @@ class PrettyTable:
             single character string used to draw bottom-right line junctions
         bottom_left_junction_char -
             single character string used to draw bottom-left line junctions
-        sortby - name of field to sort rows by
+        sortby - name of field to sort rows by, or list of field names or (field
+            name, reverse) pairs to sort by several fields
         sort_key - sorting key function, applied to data points before sorting
+        row_filter - function to choose the rows to print, or dictionary of field
+            names and the values rows must have in them to be printed
         align - default align for each column (None, "l", "c" or "r")
         valign - default valign for each row (None, "t", "m" or "b")
         reversesort - True or False to sort in descending or ascending order
-        oldsortslice - Slice rows before sorting in the "old style" """
+        oldsortslice - Slice rows before sorting in the "old style"
+        width_estimate - size columns from a sample of about this many rows
+        format_executor - concurrent.futures executor used to format large tables
+        columnar - store the data one column at a time rather than row by row
+        max_rows - keep at most this many rows, deleting the oldest ones to make room
+        column_types - dictionary of field names and the type of their values
+        categorical - field names of columns with few distinct values, to store each
+            of them once
+        sort_index - keep the sorted order of the rows between renders
+        filter_index - field names of columns to keep hash indexes of, to look up
+            the rows a row_filter dictionary asks for"""
 
         self.encoding = kwargs.get("encoding", "UTF-8")
 
         # Data
         self._field_names: list[str] = []
-        self._rows: list[RowType] = []
-        self._dividers: list[bool] = []
+        # A list of rows, a _ColumnStore, or a lazy row source (see from_sequence)
+        self._validate_true_or_false("columnar", kwargs.get("columnar", False))
+        self._columnar = kwargs.get("columnar", False)
+        self._rows: Any = _ColumnStore() if self._columnar else []
+        self._lazy_rows = False
+        # Slices of the table which read their rows from this table's storage
+        self._row_views: list[weakref.ref[_RowSlice]] = []
+        # Whether the storage is shared with a copy of the table (see copy)
+        self._shared_rows = False
+        self._shared_row_lists = False
+        self._max_rows: int | None = None
+        self._column_types = {}
+        self._categorical: list[str] = []
+        # Indices of the rows followed by a divider, in ascending order
+        self._dividers: list[int] = []
+        self._layout: _RenderLayout | None = None
+        # Formatted values of each row, kept between renders
+        self._format_key: tuple | None = None
+        self._formatted_rows = _RowCache()
+        # Display widths of formatted values, kept between renders
+        self._width_key: tuple | None = None
+        self._row_widths = _RowCache()
+        self._width_counts: list[Counter[int]] = []
+        # Sort key of each row, kept between renders
+        self._sort_keys_key: tuple | None = None
+        self._sort_keys = _RowCache()
+        # Sort keys of the rows in ascending order, and the position of the row each
+        # belongs to, for the sortby, sort_key and column types in _index_key (see
+        # sort_index). Positions count the rows deleted since the index was built:
+        # those evicted from the front, whose positions are below _index_start and
+        # whose _index_stale entries are skipped, and those deleted from elsewhere,
+        # whose positions are in _index_removed.
+        self._validate_true_or_false("sort_index", kwargs.get("sort_index", False))
+        self._sort_index = kwargs.get("sort_index", False)
+        self._index_key: tuple | None = None
+        self._index_keys: list[Any] = []
+        self._index_rows: list[int] = []
+        self._index_start = 0
+        self._index_stale = 0
+        self._index_removed: list[int] = []
+        # Positions of the rows holding each value of the filter_index columns. The
+        # positions count rows evicted from the front, _filter_offset of them.
+        self._filter_index: list[str] = []
+        self._filter_indexes: dict[str, dict[Any, list[int]] | None] = {}
+        self._filter_indexed = 0
+        self._filter_offset = 0
         self.align = {}
         self.valign = {}
         self.max_width = {}
@@ -276,6 +946,9 @@ class PrettyTable:
             "none_format",
             "escape_header",
             "escape_data",
+            "width_estimate",
+            "format_executor",
+            "row_filter",
         ]
         for option in self._options:
             if option in kwargs:
@@ -310,7 +983,7 @@ class PrettyTable:
             self._reversesort = kwargs["reversesort"]
         else:
             self._reversesort = False
-        self._sort_key = kwargs["sort_key"] or (lambda x: x)
+        self._sort_key = kwargs["sort_key"] or _default_sort_key
 
         if kwargs["escape_data"] in (True, False):
             self._escape_data = kwargs["escape_data"]
@@ -360,6 +1033,18 @@ class PrettyTable:
             self._oldsortslice = kwargs["oldsortslice"]
         else:
             self._oldsortslice = False
+        self._width_estimate = kwargs["width_estimate"] or None
+        self._width_overflow = 0
+        self._format_executor = kwargs["format_executor"] or None
+        self._row_filter = kwargs["row_filter"] or None
+        if kwargs.get("max_rows") is not None:
+            self.max_rows = kwargs["max_rows"]
+        if kwargs.get("column_types"):
+            self.column_types = kwargs["column_types"]
+        if kwargs.get("categorical") is not None:
+            self.categorical = kwargs["categorical"]
+        if kwargs.get("filter_index") is not None:
+            self.filter_index = kwargs["filter_index"]
         self._format = kwargs["format"] or False
         self._xhtml = kwargs["xhtml"] or False
         self._attributes = kwargs["attributes"] or {}
@@ -399,19 +1084,38 @@ class PrettyTable:
             raise AttributeError(name)
 
     def __getitem__(self, index: int | slice) -> PrettyTable:
-        new = PrettyTable()
-        new.field_names = self.field_names
-        for attr in self._options:
-            setattr(new, "_" + attr, getattr(self, "_" + attr))
-        setattr(new, "_align", getattr(self, "_align"))
+        """Return a new table with some of the rows of this one.
+
+        The new table is a view: its rows are read from this table as they are
+        printed, and only copied when either table is changed."""
+        indices = range(len(self._rows))
         if isinstance(index, slice):
-            for row in self._rows[index]:
-                new.add_row(row)
+            indices = indices[index]
         elif isinstance(index, int):
-            new.add_row(self._rows[index])
+            row_index = indices[index]
+            indices = indices[row_index : row_index + 1]
         else:
             msg = f"Index {index} is invalid, must be an integer or slice"
             raise IndexError(msg)
+
+        new = PrettyTable(columnar=self.columnar)
+        new.field_names = self.field_names
+        for attr in self._options:
+            setattr(new, "_" + attr, getattr(self, "_" + attr))
+        setattr(new, "_align", getattr(self, "_align"))
+        # Settings that aren't options, but change how rows are stored and sorted
+        new._column_types = self._column_types.copy()
+        new._categorical = self._categorical[:]
+        new._max_rows = self._max_rows
+        new._sort_index = self._sort_index
+        new._filter_index = self._filter_index[:]
+        view = _RowSlice(self._rows, indices, None if self._lazy_rows else self)
+        owner = view.owner
+        if owner is not None and owner._rows is view.rows:
+            owner._row_views = [ref for ref in owner._row_views if ref() is not None]
+            owner._row_views.append(weakref.ref(view))
+        new._rows = view
+        new._lazy_rows = True
         return new
 
     def __str__(self) -> str:
@@ -455,12 +1159,17 @@ class PrettyTable:
             "padding_width",
             "left_padding_width",
             "right_padding_width",
+            "width_estimate",
         ):
             self._validate_nonnegative_int(option, val)
         elif option == "sortby":
-            self._validate_field_name(option, val)
+            self._validate_sortby(option, val)
         elif option == "sort_key":
             self._validate_function(option, val)
+        elif option == "format_executor":
+            self._validate_executor(option, val)
+        elif option == "row_filter":
+            self._validate_row_filter(option, val)
         elif option == "hrules":
             self._validate_hrules(option, val)
         elif option == "vrules":
@@ -570,6 +1279,13 @@ class PrettyTable:
             msg = f"Invalid value for {name}: {val}"
             raise ValueError(msg)
 
+    def _validate_field_name_list(self, name, val):
+        try:
+            assert isinstance(val, Iterable) and not isinstance(val, str)
+        except AssertionError:
+            msg = f"Invalid value for {name}. Must be a list of field names."
+            raise ValueError(msg)
+
     def _validate_true_or_false(self, name, val):
         try:
             assert val in (True, False)
@@ -612,6 +1328,38 @@ class PrettyTable:
             msg = f"Invalid value for {name}. Must be a function."
             raise ValueError(msg)
 
+    def _validate_column_types(self, name, val):
+        try:
+            assert isinstance(val, dict)
+            assert all(column_type in _CONVERTERS for column_type in val.values())
+        except AssertionError:
+            msg = (
+                f"Invalid value for {name}. Must be a dict of field names and int, "
+                "float, str, bool, Decimal, date or datetime."
+            )
+            raise ValueError(msg)
+
+    def _validate_executor(self, name, val):
+        try:
+            assert val is None or hasattr(getattr(val, "map", None), "__call__")
+        except AssertionError:
+            msg = f"Invalid value for {name}. Must be an executor or None."
+            raise ValueError(msg)
+
+    def _validate_row_filter(self, name, val):
+        if isinstance(val, Mapping):
+            for field in val:
+                self._validate_field_name(name, field)
+            return
+        try:
+            assert val is None or hasattr(val, "__call__")
+        except AssertionError:
+            msg = (
+                f"Invalid value for {name}. Must be a function, a dictionary of "
+                "field names and values, or None."
+            )
+            raise ValueError(msg)
+
     def _validate_hrules(self, name, val):
         try:
             assert val in list(HRuleStyle)
@@ -633,6 +1381,21 @@ class PrettyTable:
             msg = f"Invalid field name: {val}"
             raise ValueError(msg)
 
+    def _validate_sortby(self, name, val):
+        if val is None or isinstance(val, str):
+            self._validate_field_name(name, val)
+            return
+        try:
+            for field in val:
+                if not isinstance(field, str):
+                    assert isinstance(field, tuple)
+                    assert len(field) == 2
+                    field = field[0]
+                self._validate_field_name(name, field)
+        except AssertionError:
+            msg = "Sort fields must be field names or (field name, reverse) pairs"
+            raise ValueError(msg)
+
     def _validate_all_field_names(self, name, val):
         try:
             for x in val:
@@ -660,11 +1423,119 @@ class PrettyTable:
     ##############################
     @property
     def rows(self) -> list[RowType]:
-        return self._rows[:]
+        return [list(row) for row in self._rows]
+
+    @property
+    def columnar(self) -> bool:
+        """Whether the data is stored one column at a time rather than row by row
+
+        Arguments:
+
+        columnar - True to keep a list of values per column, which makes adding
+            and deleting columns cheap and lets values be formatted a column at a
+            time, or False to keep a list per row"""
+        return self._columnar
+
+    @columnar.setter
+    def columnar(self, val: bool) -> None:
+        self._validate_true_or_false("columnar", val)
+        if val != self._columnar:
+            self._own_rows()
+            self._columnar = val
+            if not val:
+                # Only columns a column at a time can be encoded
+                self._categorical = []
+            self._rows = self._new_row_store(self._rows)
+
+    @property
+    def max_rows(self) -> int | None:
+        """Maximum number of rows to keep
+
+        Arguments:
+
+        max_rows - when adding rows would take the table over this many, the oldest
+            rows are deleted to make room. None keeps every row."""
+        return self._max_rows
+
+    @max_rows.setter
+    def max_rows(self, val: int | None) -> None:
+        if val is not None:
+            self._validate_nonnegative_int("max_rows", val)
+        self._own_rows()
+        self._max_rows = val or None
+        self._rows = self._new_row_store(self._rows)
+        if self._max_rows and len(self._rows) > self._max_rows:
+            self._evict_rows(len(self._rows) - self._max_rows)
+
+    @property
+    def categorical(self) -> list[str]:
+        """Field names of the columns whose values are dictionary encoded
+
+        Arguments:
+
+        categorical - field names of columns with few distinct values, which are
+            each stored, formatted and escaped once, while the column only keeps a
+            small integer code per row. Setting this makes the table columnar."""
+        return self._categorical
+
+    @categorical.setter
+    def categorical(self, val: Iterable[str]) -> None:
+        self._validate_field_name_list("categorical", val)
+        val = list(dict.fromkeys(str(field) for field in val))
+        if val:
+            self.columnar = True
+        self._categorical = val
+        if isinstance(self._rows, _ColumnStore):
+            self._own_rows()
+            columns = self._rows.columns
+            for index, field in enumerate(self._field_names[: len(columns)]):
+                if field not in val and isinstance(columns[index], _CategoryColumn):
+                    columns[index] = self._rows.gather(
+                        columns[index], range(len(columns[index]))
+                    )
+            self._encode_categories(self._rows)
+
+    @property
+    def filter_index(self) -> list[str]:
+        """Field names of the columns kept in hash indexes for row_filter
+
+        Arguments:
+
+        filter_index - field names of columns that rows are often filtered on with
+            a row_filter dictionary. The rows holding each value of these columns
+            are looked up in an index rather than by checking every row."""
+        return self._filter_index
+
+    @filter_index.setter
+    def filter_index(self, val: Iterable[str]) -> None:
+        self._validate_field_name_list("filter_index", val)
+        self._filter_index = list(dict.fromkeys(str(field) for field in val))
+        self._drop_filter_indexes()
+
+    @property
+    def sort_index(self) -> bool:
+        """Whether the sorted order of the rows is kept between renders
+
+        Arguments:
+
+        sort_index - True to keep the rows sorted by sortby and sort_key in an
+            index, which rows are added to and deleted from as the table changes,
+            so that printing the table sorted again doesn't sort it from scratch"""
+        return self._sort_index
+
+    @sort_index.setter
+    def sort_index(self, val: bool) -> None:
+        self._validate_true_or_false("sort_index", val)
+        self._sort_index = val
+        if not val:
+            self._drop_sort_index()
 
     @property
     def dividers(self) -> list[bool]:
-        return self._dividers[:]
+        dividers = [False] * len(self._rows)
+        for index in self._dividers:
+            dividers[index] = True
+        return dividers
 
     @property
     def xhtml(self) -> bool:
@@ -709,6 +1580,23 @@ class PrettyTable:
         if self._field_names:
             old_names = self._field_names[:]
         self._field_names = val
+        # Sort keys are kept by field name, which may now be another column
+        self._drop_sort_keys()
+        self._drop_filter_indexes()
+        if old_names:
+            renames = dict(zip(old_names, val))
+            self._categorical = [
+                renames.get(field, field) for field in self._categorical
+            ]
+            self._filter_index = [
+                renames.get(field, field) for field in self._filter_index
+            ]
+        if self._column_types and old_names:
+            self._column_types = {
+                new_name: self._column_types[old_name]
+                for old_name, new_name in zip(old_names, val)
+                if old_name in self._column_types
+            }
         if self._align and old_names:
             for old_name, new_name in zip(old_names, val):
                 self._align[new_name] = self._align[old_name]
@@ -877,16 +1765,18 @@ class PrettyTable:
         self._end = val
 
     @property
-    def sortby(self) -> str | None:
+    def sortby(self) -> SortByType | None:
         """Name of field by which to sort rows
 
         Arguments:
 
-        sortby - field name to sort by"""
+        sortby - field name to sort by, or list of field names to sort by in turn,
+            each of which can be a (field name, reverse) pair to sort that field in
+            descending order"""
         return self._sortby
 
     @sortby.setter
-    def sortby(self, val: str | None) -> None:
+    def sortby(self, val: SortByType | None) -> None:
         self._validate_option("sortby", val)
         self._sortby = val
 
@@ -1064,6 +1954,33 @@ class PrettyTable:
             msg = "The custom_format property need to be a dictionary or callable"
             raise TypeError(msg)
 
+    @property
+    def column_types(self) -> dict[str, type]:
+        """Controls the type of the values of each column
+
+        Arguments:
+
+        column_types - dictionary of field names and one of int, float, str, bool,
+            decimal.Decimal, datetime.date or datetime.datetime. Values added to
+            those columns are converted to the type, and missing values (None or
+            empty strings) become None. Returns a copy, assign a new dictionary to
+            change the types."""
+        return dict(self._column_types)
+
+    @column_types.setter
+    def column_types(self, val: Mapping[str, type] | None) -> None:
+        val = dict(val or {})
+        self._validate_column_types("column_types", val)
+        typed = self._get_typed_columns(val)
+        self._own_rows()
+        if typed and len(self._rows):
+            # Convert every row before changing anything, in case one can't be
+            self._rows = self._new_row_store(
+                self._convert_rows(list(self._rows), typed)
+            )
+            self._reset_row_caches()
+        self._column_types = val
+
     @property
     def padding_width(self) -> int:
         """The number of empty spaces between a column's edge and its content
@@ -1350,6 +2267,64 @@ class PrettyTable:
         self._validate_option("oldsortslice", val)
         self._oldsortslice = val
 
+    @property
+    def width_estimate(self) -> int | None:
+        """Size columns from a sample of rows instead of measuring every row
+
+        Arguments:
+
+        width_estimate - approximate number of rows to sample (the first, the last
+            and evenly spaced ones in between), or None to measure every row. Values
+            wider than their column are wrapped, see width_overflow."""
+        return self._width_estimate
+
+    @width_estimate.setter
+    def width_estimate(self, val: int | None) -> None:
+        if val is not None:
+            self._validate_option("width_estimate", val)
+        self._width_estimate = val or None
+
+    @property
+    def format_executor(self) -> Executor | None:
+        """Executor used to run the int_format, float_format and custom_format
+        formatting of large tables in parallel
+
+        Arguments:
+
+        format_executor - a concurrent.futures executor, such as a
+            ThreadPoolExecutor, or None to format rows one after another. The
+            executor is not shut down by the table. A ProcessPoolExecutor needs
+            custom_format functions that can be pickled."""
+        return self._format_executor
+
+    @format_executor.setter
+    def format_executor(self, val: Executor | None) -> None:
+        self._validate_option("format_executor", val)
+        self._format_executor = val
+
+    @property
+    def row_filter(self) -> RowFilterType | None:
+        """Function or dictionary choosing the rows to print
+
+        Arguments:
+
+        row_filter - a function which takes the values of a row and returns True
+            to print it, or a dictionary of field names and values, to print the
+            rows holding all of those values, or None to print every row"""
+        return self._row_filter
+
+    @row_filter.setter
+    def row_filter(self, val: RowFilterType | None) -> None:
+        self._validate_option("row_filter", val)
+        self._row_filter = val
+
+    @property
+    def width_overflow(self) -> int:
+        """Number of values that were wider than their column in the last plain text
+        rendering of the table, and so had to be wrapped. This includes values
+        which are wider than max_width, or not measured due to width_estimate."""
+        return self._width_overflow
+
     @property
     def escape_header(self) -> bool:
         """Escapes the text within a header (True or False)"""
@@ -1507,15 +2482,51 @@ class PrettyTable:
     # DATA INPUT METHODS         #
     ##############################
 
-    def add_rows(self, rows: Iterable[RowType]) -> None:
+    def add_rows(self, rows: Iterable[RowType], *, copy: bool = True) -> None:
         """Add rows to the table
 
+        All of the rows are checked before any are added, so if one of them has the
+        wrong number of values, the table is left unchanged.
+
         Arguments:
 
         rows - rows of data, should be an iterable of lists, each list with as many
-        elements as the table has fields"""
+        elements as the table has fields
+        copy - if False, rows which are lists are stored as they are instead of
+        being copied, so they must not be modified afterwards"""
+
+        if not isinstance(rows, (list, tuple)):
+            rows = list(rows)
+        if not rows:
+            return
+        width = len(self._field_names) if self._field_names else len(rows[0])
         for row in rows:
-            self.add_row(row)
+            if len(row) != width:
+                msg = (
+                    "Row has incorrect number of values, "
+                    f"(actual) {len(row)}!={width} (expected)"
+                )
+                raise ValueError(msg)
+        if not self._field_names:
+            self.field_names = [f"Field {n + 1}" for n in range(0, width)]
+        if self._column_types:
+            rows = self._convert_rows(rows, self._get_typed_columns())
+
+        self._own_rows()
+        if self._max_rows:
+            rows = rows[-self._max_rows :]
+            if len(self._rows) + len(rows) > self._max_rows:
+                self._evict_rows(len(self._rows) + len(rows) - self._max_rows)
+        if isinstance(self._rows, _ColumnStore):
+            self._rows.extend(rows)
+            self._encode_categories(self._rows)
+        elif copy:
+            self._rows.extend([list(row) for row in rows])
+        else:
+            self._rows.extend(
+                row if isinstance(row, list) else list(row) for row in rows
+            )
+        self._add_to_sort_index(len(self._rows) - len(rows))
 
     def add_row(self, row: RowType, *, divider: bool = False) -> None:
         """Add a row to the table
@@ -1533,8 +2544,16 @@ class PrettyTable:
             raise ValueError(msg)
         if not self._field_names:
             self.field_names = [f"Field {n + 1}" for n in range(0, len(row))]
+        if self._column_types:
+            row = self._convert_rows([row], self._get_typed_columns())[0]
+        self._own_rows()
+        if self._max_rows and len(self._rows) >= self._max_rows:
+            self._evict_rows(len(self._rows) - self._max_rows + 1)
         self._rows.append(list(row))
-        self._dividers.append(divider)
+        self._encode_categories(self._rows)
+        if divider:
+            self._dividers.append(len(self._rows) - 1)
+        self._add_to_sort_index(len(self._rows) - 1)
 
     def del_row(self, row_index: int) -> None:
         """Delete a row from the table
@@ -1549,8 +2568,217 @@ class PrettyTable:
                 f"table only has {len(self._rows)} rows"
             )
             raise IndexError(msg)
+        self._own_rows()
+        # The key of the row is needed to find it in the sort index
+        self._drop_from_sort_index(row_index)
         del self._rows[row_index]
-        del self._dividers[row_index]
+        if row_index < 0:
+            row_index += len(self._rows) + 1
+        self._drop_dividers(row_index, row_index + 1)
+        self._drop_row_caches(row_index, row_index + 1)
+
+    def _evict_rows(self, count: int) -> None:
+        """Delete the oldest rows, to make room for new ones within max_rows"""
+        for _ in range(count):
+            del self._rows[0]
+        self._drop_dividers(0, count)
+        self._drop_row_caches(0, count)
+        self._evict_from_sort_index(count)
+
+    def _drop_dividers(self, start: int, stop: int) -> None:
+        """Forget the dividers of rows that have been deleted, and move those of the
+        rows after them up"""
+        dividers = self._dividers
+        first = bisect_left(dividers, start)
+        later = bisect_left(dividers, stop)
+        dividers[first:] = [index - (stop - start) for index in dividers[later:]]
+
+    def _drop_row_caches(self, start: int, stop: int) -> None:
+        """Forget the formatted values, widths, sort keys and filter index entries of
+        rows that have been deleted"""
+        del self._formatted_rows[start:stop]
+        for index in range(start, min(stop, len(self._row_widths))):
+            for counts, width in zip(self._width_counts, self._row_widths[index]):
+                counts[width] -= 1
+                if not counts[width]:
+                    del counts[width]
+        del self._row_widths[start:stop]
+        del self._sort_keys[start:stop]
+        if not self._filter_indexed:
+            return
+        if start == 0 and stop <= self._filter_indexed:
+            # Rows evicted from the front are skipped when looking up, rather than
+            # moving every position up
+            self._filter_offset += stop
+            self._filter_indexed -= stop
+            if self._filter_offset > len(self._rows):
+                self._drop_filter_indexes()
+        else:
+            self._drop_filter_indexes()
+
+    def _drop_filter_indexes(self) -> None:
+        self._filter_indexes = {}
+        self._filter_indexed = 0
+        self._filter_offset = 0
+
+    def _update_filter_indexes(self) -> None:
+        """Add the rows added since the last lookup to the filter indexes"""
+        if self._filter_indexed == len(self._rows):
+            return
+        columns = [
+            (field, self._field_names.index(field))
+            for field in self._filter_index
+            if field in self._field_names
+        ]
+        indexes = self._filter_indexes
+        for field, _ in columns:
+            indexes.setdefault(field, {})
+        for index in range(self._filter_indexed, len(self._rows)):
+            row = self._rows[index]
+            position = index + self._filter_offset
+            for field, column in columns:
+                if (values := indexes[field]) is None:
+                    continue
+                try:
+                    values.setdefault(row[column], []).append(position)
+                except TypeError:
+                    # Values that can't be hashed can only be found by checking
+                    # every row
+                    indexes[field] = None
+        self._filter_indexed = len(self._rows)
+
+    def _add_to_sort_index(self, start: int) -> None:
+        """Add the rows from start to the end of the table to the sort index, if
+        there is one"""
+        if self._index_key is None:
+            return
+        sortby, sort_key, _, descending = self._index_key
+        fields = [sortby] if isinstance(sortby, str) else [f for f, _ in sortby]
+        if (
+            len(self._rows) - start > len(self._index_rows) - self._index_stale
+            or not set(fields) <= set(self._field_names)
+            # The column types changed, so the keys would be made differently
+            or self._index_key != self._get_sort_cache_key(sortby, sort_key, descending)
+        ):
+            # Cheaper to sort everything again when the table is next printed
+            self._drop_sort_index()
+            return
+        row_key = self._get_sort_key(sortby, sort_key, descending)
+        # Every deleted row comes before the new ones
+        offset = self._index_start + len(self._index_removed)
+        for index in range(start, len(self._rows)):
+            row = self._rows[index]
+            key = row_key(row if isinstance(row, list) else list(row))
+            try:
+                # After any equal keys, as the row comes after them in the table
+                position = bisect_right(self._index_keys, key)
+            except TypeError:
+                # Left for sorting to report when the table is next printed
+                self._drop_sort_index()
+                return
+            self._index_keys.insert(position, key)
+            self._index_rows.insert(position, index + offset)
+
+    def _drop_from_sort_index(self, row_index: int) -> None:
+        """Forget a row that is about to be deleted from the middle of the table.
+
+        The row is found by bisecting on its key, and its position is remembered
+        so that the rows after it have their indices moved up when they are looked
+        up, rather than rewriting the whole index now."""
+        if self._index_key is None:
+            return
+        if row_index < 0:
+            row_index += len(self._rows)
+        sortby, sort_key, _, descending = self._index_key
+        row = self._rows[row_index]
+        key = self._get_sort_key(sortby, sort_key, descending)(
+            row if isinstance(row, list) else list(row)
+        )
+        position = self._get_index_position(row_index)
+        # Rows with equal keys are in the order of their positions
+        keys = self._index_keys
+        try:
+            first = bisect_left(keys, key)
+            last = bisect_right(keys, key, first)
+        except TypeError:
+            first = last = 0
+        found = bisect_left(self._index_rows, position, first, last)
+        if found == last or self._index_rows[found] != position:
+            # The row has been changed in place since it was indexed
+            self._drop_sort_index()
+            return
+        del keys[found]
+        del self._index_rows[found]
+        self._index_removed.insert(bisect_left(self._index_removed, position), position)
+        self._compact_sort_index()
+
+    def _evict_from_sort_index(self, count: int) -> None:
+        """Forget the rows evicted from the front of the table. Their entries are
+        skipped when the index is read, until they outnumber the rows left."""
+        if self._index_key is None:
+            return
+        # The first row left, counting the rows already deleted
+        start = self._get_index_position(count)
+        del self._index_removed[: bisect_left(self._index_removed, start)]
+        self._index_start = start
+        self._index_stale += count
+        self._compact_sort_index()
+
+    def _get_index_position(self, index: int) -> int:
+        """Return the position of the row at index in the sort index, which is
+        its index plus the number of rows deleted before it"""
+        position = index + self._index_start
+        removed = self._index_removed
+        passed = 0
+        while (before := bisect_right(removed, position)) != passed:
+            position += before - passed
+            passed = before
+        return position
+
+    def _get_index_rows(
+        self, positions: Iterable[int], keep: set[int] | None = None
+    ) -> Iterator[int]:
+        """Yield the indices of the rows at positions of the sort index, skipping
+        those evicted from the table, and those not in keep, if given"""
+        start = self._index_start
+        removed = self._index_removed
+        for position in positions:
+            if position < start:
+                continue
+            index = position - start
+            if removed:
+                index -= bisect_left(removed, position)
+            if keep is None or index in keep:
+                yield index
+
+    def _compact_sort_index(self) -> None:
+        """Drop the entries of evicted rows from the sort index and number its rows
+        by their indices again, once deleted rows outnumber the rows left"""
+        left = len(self._index_rows) - self._index_stale
+        if self._index_stale + len(self._index_removed) <= left:
+            return
+        keys = self._index_keys
+        rows = self._index_rows
+        start = self._index_start
+        self._index_keys = [key for key, row in zip(keys, rows) if row >= start]
+        self._index_rows = list(self._get_index_rows(rows))
+        self._index_start = 0
+        self._index_stale = 0
+        self._index_removed = []
+
+    def _drop_sort_index(self) -> None:
+        self._index_key = None
+        self._index_keys = []
+        self._index_rows = []
+        self._index_start = 0
+        self._index_stale = 0
+        self._index_removed = []
+
+    def _drop_sort_keys(self) -> None:
+        """Forget the sort keys and sorted order kept for the rows"""
+        self._sort_keys_key = None
+        self._sort_keys = _RowCache()
+        self._drop_sort_index()
 
     def add_column(
         self,
@@ -1571,23 +2799,99 @@ class PrettyTable:
         valign - desired vertical alignment for new columns - "t" for top,
             "m" for middle and "b" for bottom"""
 
-        if len(self._rows) in (0, len(column)):
-            self._validate_align(align)
-            self._validate_valign(valign)
+        self.add_columns({fieldname: column}, align, valign)
+
+    def add_columns(
+        self,
+        columns: Mapping[str, Sequence[Any]],
+        align: AlignType = "c",
+        valign: VAlignType = "t",
+    ) -> None:
+        """Add several columns to the table at once, visiting each row only once.
+
+        Arguments:
+
+        columns - mapping of the name of each new field to its column of data,
+        which should have as many elements as the table has rows
+        align - desired alignment for the new columns - "l" for left, "c" for
+            centre and "r" for right
+        valign - desired vertical alignment for the new columns - "t" for top,
+            "m" for middle and "b" for bottom"""
+
+        if not columns:
+            return
+        length = len(self._rows) or len(next(iter(columns.values())))
+        for column in columns.values():
+            if len(column) != length:
+                msg = (
+                    f"Column length {len(column)} does not match number of rows "
+                    f"{length}"
+                )
+                raise ValueError(msg)
+        self._validate_align(align)
+        self._validate_valign(valign)
+        columns = {
+            fieldname: (
+                [_convert_value(column_type, value) for value in column]
+                if (column_type := self._column_types.get(fieldname))
+                else column
+            )
+            for fieldname, column in columns.items()
+        }
+
+        caches_valid = self._row_caches_valid()
+        start = len(self._field_names)
+        for fieldname in columns:
             self._field_names.append(fieldname)
             self._align[fieldname] = align
             self._valign[fieldname] = valign
-            for i in range(0, len(column)):
-                if len(self._rows) < i + 1:
-                    self._rows.append([])
-                    self._dividers.append(False)
-                self._rows[i].append(column[i])
+        self._own_rows(copy_rows=True)
+        # The sort keys are made from whole rows, which are about to change
+        self._drop_sort_keys()
+        self._drop_filter_indexes()
+        values: list[Any] = list(columns.values())
+        if isinstance(self._rows, _ColumnStore):
+            for index, column in enumerate(values, start):
+                self._rows.insert_column(index, column)
+            self._encode_categories(self._rows)
+            # Rows read from arrays hold Python scalars, so format those
+            values = [
+                column.tolist() if _is_array(column) else column for column in values
+            ]
         else:
-            msg = (
-                f"Column length {len(column)} does not match number of rows "
-                f"{len(self._rows)}"
-            )
-            raise ValueError(msg)
+            if not self._rows:
+                self._rows.extend([] for _ in range(length))
+            for row, new_values in zip(self._rows, zip(*values)):
+                row.extend(new_values)
+
+        if not caches_valid:
+            self._reset_row_caches()
+            return
+        # Format and measure just the new values of the rows that are cached. Rows
+        # may have been measured without their formatted values being kept, so
+        # those are formatted again to measure them.
+        fields = list(columns)
+        cache = self._formatted_rows
+        for index in range(max(len(cache), len(self._row_widths))):
+            formatted_row = cache[index] if index < len(cache) else None
+            measured = index < len(self._row_widths)
+            if formatted_row is None and not measured:
+                continue
+            new_cells = [
+                self._format_value(field, column[index])
+                for field, column in zip(fields, values)
+            ]
+            if formatted_row is not None:
+                cache[index] = formatted_row + new_cells
+            if measured:
+                self._row_widths[index] += self._get_cell_widths(new_cells, fields)
+        new_counts: list[Counter[int]] = [Counter() for _ in fields]
+        for cell_widths in self._row_widths:
+            for counts, width in zip(new_counts, cell_widths[start:]):
+                counts[width] += 1
+        self._width_counts += new_counts
+        self._format_key = self._get_format_key()
+        self._width_key = self._get_width_key()
 
     def add_autoindex(self, fieldname: str = "Index") -> None:
         """Add an auto-incrementing index column to the table.
@@ -1596,6 +2900,11 @@ class PrettyTable:
         self._field_names.insert(0, fieldname)
         self._align[fieldname] = self.align
         self._valign[fieldname] = self.valign
+        self._reset_row_caches()
+        self._own_rows(copy_rows=True)
+        if isinstance(self._rows, _ColumnStore):
+            self._rows.insert_column(0, range(1, len(self._rows) + 1))
+            return
         for i, row in enumerate(self._rows):
             row.insert(0, i + 1)
 
@@ -1606,43 +2915,261 @@ class PrettyTable:
 
         fieldname - The field name of the column you want to delete."""
 
-        if fieldname not in self._field_names:
-            msg = (
-                "Can't delete column {!r} which is not a field name of this table."
-                " Field names are: {}".format(
-                    fieldname, ", ".join(map(repr, self._field_names))
+        self._check_field_names([fieldname])
+        self._remove_columns([self._field_names.index(fieldname)])
+
+    def del_columns(self, fieldnames: Iterable[str]) -> None:
+        """Delete several columns from the table at once, visiting each row only
+        once. Unlike del_column, the alignment, width and format options of the
+        deleted fields are removed as well.
+
+        Arguments:
+
+        fieldnames - The field names of the columns you want to delete."""
+
+        fieldnames = set(fieldnames)
+        self._check_field_names(fieldnames)
+        caches_valid = self._row_caches_valid()
+        self._remove_columns(
+            [i for i, field in enumerate(self._field_names) if field in fieldnames]
+        )
+        for options in (
+            self._align,
+            self._valign,
+            self._max_width,
+            self._min_width,
+            self._int_format,
+            self._float_format,
+            self._custom_format,
+            self._none_format,
+            self._column_types,
+        ):
+            for fieldname in fieldnames:
+                options.pop(fieldname, None)
+        self._categorical = [
+            field for field in self._categorical if field not in fieldnames
+        ]
+        self._filter_index = [
+            field for field in self._filter_index if field not in fieldnames
+        ]
+        if caches_valid:
+            self._format_key = self._get_format_key()
+            self._width_key = self._get_width_key()
+
+    def _check_field_names(self, fieldnames: Iterable[str]) -> None:
+        for fieldname in fieldnames:
+            if fieldname not in self._field_names:
+                msg = (
+                    "Can't delete column {!r} which is not a field name of this "
+                    "table. Field names are: {}".format(
+                        fieldname, ", ".join(map(repr, self._field_names))
+                    )
+                )
+                raise ValueError(msg)
+
+    def _remove_columns(self, indices: list[int]) -> None:
+        """Delete the columns at the given ascending indices from the field names
+        and the rows, and from the formatted values and widths kept for the rows"""
+        caches_valid = self._row_caches_valid()
+        removed = set(indices)
+        keep = [i for i in range(len(self._field_names)) if i not in removed]
+        for index in reversed(indices):
+            del self._field_names[index]
+        self._own_rows(copy_rows=True)
+        self._drop_sort_keys()
+        self._drop_filter_indexes()
+        if isinstance(self._rows, _ColumnStore):
+            for index in reversed(indices):
+                self._rows.del_column(index)
+        else:
+            for row in self._rows:
+                for index in reversed(indices):
+                    del row[index]
+
+        if not caches_valid:
+            self._reset_row_caches()
+            return
+        self._formatted_rows = _RowCache(
+            None if row is None else [row[i] for i in keep]
+            for row in self._formatted_rows
+        )
+        self._row_widths = _RowCache(
+            tuple([cell_widths[i] for i in keep]) for cell_widths in self._row_widths
+        )
+        self._width_counts = [self._width_counts[i] for i in keep]
+        self._format_key = self._get_format_key()
+        self._width_key = self._get_width_key()
+
+    def _own_rows(self, copy_rows: bool = False) -> None:
+        """Make sure the table has rows of its own, before they are modified.
+
+        The rows of a lazy row source are copied into the table. If slices of the
+        table are still reading from its rows, the table copies its list of rows so
+        that the slices keep seeing them as they were, and likewise if it shares
+        them with a copy. The row lists themselves are only copied when they are
+        about to be changed in place.
+
+        Arguments:
+
+        copy_rows - whether the row lists will be changed in place"""
+        if self._lazy_rows:
+            self._lazy_rows = False
+            self._rows = self._new_row_store([list(row) for row in self._rows])
+        elif self._shared_rows or any(ref() is not None for ref in self._row_views):
+            if isinstance(self._rows, _ColumnStore):
+                self._rows = self._rows.copy()
+            else:
+                self._rows = self._new_row_store(self._rows)
+                self._shared_row_lists = True
+        self._shared_rows = False
+        self._row_views = []
+        if copy_rows and self._shared_row_lists:
+            self._rows = self._new_row_store([list(row) for row in self._rows])
+            self._shared_row_lists = False
+
+    def _new_row_store(self, rows: Iterable[RowType] = ()) -> Any:
+        """Return a container of the given rows of the kind the table stores its
+        rows in: a _ColumnStore for a columnar table, a deque when the number of
+        rows is limited by max_rows, so that the oldest can be deleted quickly, or
+        else a list"""
+        if self._columnar:
+            store = _ColumnStore(rows)
+            self._encode_categories(store)
+            return store
+        if self._max_rows:
+            return deque(rows)
+        return list(rows)
+
+    def _get_typed_columns(
+        self, column_types: Mapping[str, type] | None = None
+    ) -> list[tuple[int, type]]:
+        """Return the index and type of each column with a declared type"""
+        if column_types is None:
+            column_types = self._column_types
+        return [
+            (index, column_types[field])
+            for index, field in enumerate(self._field_names)
+            if field in column_types
+        ]
+
+    def _convert_rows(
+        self, rows: Sequence[RowType], typed: list[tuple[int, type]]
+    ) -> list[RowType]:
+        """Return the rows with the values of the given columns converted to their
+        types. Rows whose values already have the right types are returned as they
+        are, the others are copied."""
+        converted = []
+        for row in rows:
+            if any(
+                type(row[index]) is not column_type and row[index] is not None
+                for index, column_type in typed
+            ):
+                row = list(row)
+                for index, column_type in typed:
+                    row[index] = _convert_value(column_type, row[index])
+            converted.append(row)
+        return converted
+
+    def _encode_categories(self, store: Any) -> None:
+        """Put _CategoryColumns in place of the categorical columns of a columnar
+        table's store that aren't encoded yet, such as those created by adding the
+        first rows"""
+        if not self._categorical or not isinstance(store, _ColumnStore):
+            return
+        columns = store.columns
+        for index, field in enumerate(self._field_names[: len(columns)]):
+            if field in self._categorical and not isinstance(
+                columns[index], _CategoryColumn
+            ):
+                columns[index] = _CategoryColumn(
+                    store.gather(columns[index], range(len(columns[index])))
                 )
+
+    def _check_row(self, row: RowType) -> RowType:
+        if len(row) != len(self._field_names):
+            msg = (
+                "Row has incorrect number of values, "
+                f"(actual) {len(row)}!={len(self._field_names)} (expected)"
             )
             raise ValueError(msg)
-
-        col_index = self._field_names.index(fieldname)
-        del self._field_names[col_index]
-        for row in self._rows:
-            del row[col_index]
+        return row
 
     def clear_rows(self) -> None:
         """Delete all rows from the table but keep the current field names"""
 
-        self._rows = []
+        self._lazy_rows = False
+        self._rows = self._new_row_store()
         self._dividers = []
+        self._reset_row_caches()
 
     def clear(self) -> None:
         """Delete all rows and field names from the table, maintaining nothing but
         styling options"""
 
-        self._rows = []
+        self._lazy_rows = False
+        self._rows = self._new_row_store()
         self._dividers = []
         self._field_names = []
         self._widths = []
+        self._reset_row_caches()
+
+    def infer_column_types(self) -> dict[str, type]:
+        """Give each column without a type the one that its values fit, converting
+        them, and return the new column types.
+
+        Columns of strings, as read from CSV files, get the first of int, float,
+        bool, date and datetime that all of their values can be converted to, or
+        else str. Columns of values of one of the other supported types get that
+        type, and columns with no values or values of several types get none."""
+        column_types = dict(self._column_types)
+        columns = list(zip(*self._rows)) or [() for _ in self._field_names]
+        for field, values in zip(self._field_names, columns):
+            if field not in column_types:
+                column_type = _infer_type(values)
+                if column_type is not None:
+                    column_types[field] = column_type
+        self.column_types = column_types
+        return column_types
 
     ##############################
     # MISC PUBLIC METHODS        #
     ##############################
 
-    def copy(self) -> Self:
+    def copy(self, deep: bool = False) -> Self:
+        """Return a copy of the table.
+
+        By default the copy shares its rows with this table, and whichever table
+        is changed first takes a copy of them then. The option dicts are copied,
+        but not the values in them, so custom formatters are shared.
+
+        Arguments:
+
+        deep - copy every row and option value straight away, with copy.deepcopy.
+            The format_executor is shared, not copied."""
         import copy
 
-        return copy.deepcopy(self)
+        if deep:
+            # The executor is a resource of the program, not data of the table
+            memo = {id(self._format_executor): self._format_executor}
+            new = copy.deepcopy(self, memo)
+            new._row_views = []
+            return new
+
+        new = copy.copy(self)
+        # The values kept for each row between renders are worked out again when
+        # the copy is printed, rather than copied up front
+        new._formatted_rows = _RowCache()
+        new._row_widths = _RowCache()
+        new._width_counts = []
+        new._reset_row_caches()
+        new._row_views = []
+        for name, value in vars(self).items():
+            shared = getattr(new, name) is value
+            if name != "_rows" and shared and isinstance(value, (list, dict, deque)):
+                setattr(new, name, copy.copy(value))
+        if not self._lazy_rows:
+            self._shared_rows = new._shared_rows = True
+        return new
 
     def get_formatted_string(self, out_format: str = "text", **kwargs) -> str:
         """Return string representation of specified format of table in current state.
@@ -1668,18 +3195,62 @@ class PrettyTable:
         )
         raise ValueError(msg)
 
+    ##############################
+    # FILE OUTPUT METHODS        #
+    ##############################
+
+    def dump(self, fp, out_format: str = "text", **kwargs) -> None:
+        """Write the table in the specified format straight to a file object.
+
+        The output is the same as get_formatted_string(out_format, **kwargs),
+        but it is written out piece by piece instead of being built up as one
+        string first. Binary file objects are written to in the table's encoding.
+
+        Arguments:
+
+        fp - file object opened for writing, in text or binary mode
+        out_format - resulting table format
+        kwargs - passed through to function that performs formatting"""
+
+        if out_format not in ("text", "html", "json", "csv", "latex"):
+            msg = (
+                f"Invalid format {out_format}. "
+                "Must be one of: text, html, json, csv, or latex"
+            )
+            raise ValueError(msg)
+
+        binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase))
+        if binary:
+            fp = io.TextIOWrapper(fp, encoding=self.encoding, newline="")
+        try:
+            if out_format == "text":
+                _write_lines(fp, self.iter_lines(**kwargs), "\n")
+            elif out_format == "html":
+                options = self._get_options(kwargs)
+                _write_lines(fp, self._iter_html_lines(options), "\n")
+            elif out_format == "json":
+                import json
+
+                objects, json_options = self._get_json_objects(kwargs)
+                json.dump(objects, fp, **json_options)
+            elif out_format == "csv":
+                self._write_csv(fp, **kwargs)
+            else:
+                options = self._get_options(kwargs)
+                _write_lines(fp, self._iter_latex_lines(options), "\r\n")
+        finally:
+            if binary:
+                fp.flush()
+                fp.detach()
+
     ##############################
     # MISC PRIVATE METHODS       #
     ##############################
 
     def _format_value(self, field: str, value: Any) -> str:
-        if isinstance(value, int) and field in self._int_format:
-            return (f"%{self._int_format[field]}d") % value
-        elif isinstance(value, float) and field in self._float_format:
-            return (f"%{self._float_format[field]}f") % value
-
-        formatter = self._custom_format.get(field, (lambda f, v: str(v)))
-        return formatter(field, value)
+        return _format_value(
+            field, value, self._int_format, self._float_format, self._custom_format
+        )
 
     def _compute_table_width(self, options) -> int:
         if options["vrules"] == VRuleStyle.FRAME:
@@ -1696,27 +3267,34 @@ class PrettyTable:
                 table_width += self._widths[index] + per_col_padding + 1
         return table_width
 
-    def _compute_widths(self, rows: list[list[str]], options) -> None:
+    def _compute_widths(
+        self,
+        rows: list[list[str]],
+        options,
+        indices: Sequence[int] | None = None,
+    ) -> None:
         if options["header"]:
             widths = [_get_size(field)[0] for field in self._field_names]
         else:
             widths = len(self.field_names) * [0]
 
-        for row in rows:
-            for index, value in enumerate(row):
-                fieldname = self.field_names[index]
-                if (
-                    value == "None"
-                    and (none_val := self.none_format.get(fieldname)) is not None
-                ):
-                    value = none_val
+        if rows:
+            estimate = options["width_estimate"]
+            if estimate and len(rows) > estimate:
+                # Only measure the first, the last and evenly spaced rows between
+                step = -(-len(rows) // estimate)
+                sample = rows[::step] + rows[-1:]
+                data_widths = self._get_data_widths(sample, None)
+            else:
+                data_widths = self._get_data_widths(rows, indices)
+            for index, fieldname in enumerate(self.field_names):
                 if fieldname in self.max_width:
                     widths[index] = max(
                         widths[index],
-                        min(_get_size(value)[0], self.max_width[fieldname]),
+                        min(data_widths[index], self.max_width[fieldname]),
                     )
                 else:
-                    widths[index] = max(widths[index], _get_size(value)[0])
+                    widths[index] = max(widths[index], data_widths[index])
                 if fieldname in self.min_width:
                     widths[index] = max(widths[index], self.min_width[fieldname])
 
@@ -1772,6 +3350,73 @@ class PrettyTable:
                     widths[-1] += min_width - sum(widths)
                 self._widths = widths
 
+    def _get_cell_widths(
+        self, row: list[str], fields: Sequence[str] | None = None
+    ) -> tuple[int, ...]:
+        """Return the display width of each of the formatted values of a row, or of
+        just the values of the given fields"""
+        widths = []
+        for fieldname, value in zip(fields or self._field_names, row):
+            if (
+                value == "None"
+                and (none_val := self._none_format.get(fieldname)) is not None
+            ):
+                value = none_val
+            widths.append(_get_size(value)[0])
+        return tuple(widths)
+
+    def _get_data_widths(
+        self, rows: list[list[str]], indices: Sequence[int] | None
+    ) -> list[int]:
+        """Return the widest formatted value of each column of the given rows.
+
+        When the rows are the whole table, the answer comes from the width state
+        that is kept between renders, and only rows added since the last render are
+        measured.
+
+        Arguments:
+
+        rows - formatted rows to be printed
+        indices - position of each of the rows in the table"""
+
+        if indices is None or len(indices) != len(self._rows) or self._lazy_rows:
+            # Only part of the table is printed, or the rows may have changed since
+            # the last render, measure those rows directly
+            widths = [0] * len(self._field_names)
+            for row in rows:
+                widths = list(map(max, widths, self._get_cell_widths(row)))
+            return widths
+
+        key = self._get_width_key()
+        if key != self._width_key:
+            self._width_key = key
+            self._row_widths = _RowCache()
+            self._width_counts = [Counter() for _ in self._field_names]
+
+        measured = len(self._row_widths)
+        if measured < len(self._rows):
+            new_widths: list[tuple[int, ...]] = [()] * (len(self._rows) - measured)
+            if isinstance(indices, range):
+                # Unsorted, so each row is at its own index
+                pairs = zip(indices[measured:], rows[measured:])
+            else:
+                pairs = zip(indices, rows)
+            for index, row in pairs:
+                if index >= measured:
+                    new_widths[index - measured] = self._get_cell_widths(row)
+            for cell_widths in new_widths:
+                for counts, width in zip(self._width_counts, cell_widths):
+                    counts[width] += 1
+            self._row_widths.extend(new_widths)
+
+        return [max(counts) if counts else 0 for counts in self._width_counts]
+
+    def _get_width_key(self) -> tuple:
+        """Return the settings that the widths of formatted values depend on.
+
+        Widths kept from an earlier render are only reused while this is unchanged."""
+        return self._get_format_key() + (tuple(self._none_format.items()),)
+
     def _get_padding_widths(self, options) -> tuple[int, int]:
         if options["left_padding_width"] is not None:
             lpad = options["left_padding_width"]
@@ -1783,62 +3428,449 @@ class PrettyTable:
             rpad = options["padding_width"]
         return lpad, rpad
 
-    def _get_rows(self, options) -> list[RowType]:
-        """Return only those data rows that should be printed, based on slicing and
-        sorting.
+    def _get_row_indices(self, options) -> Sequence[int]:
+        """Return the indices of those data rows that should be printed, based on
+        slicing and sorting.
+
+        Sorting and slicing work on the indices alone, so no rows are copied. When
+        only the first rows of a sorted table are printed, only those are sorted.
 
         Arguments:
 
         options - dictionary of option settings."""
-        import copy
 
+        indices: Sequence[int] = range(len(self._rows))
+        keep = None
+        if options["row_filter"] is not None:
+            indices = self._filter_rows(options["row_filter"])
+            keep = set(indices)
         if options["oldsortslice"]:
-            rows = copy.deepcopy(self._rows[options["start"] : options["end"]])
-        else:
-            rows = copy.deepcopy(self._rows)
+            indices = indices[options["start"] : options["end"]]
 
         # Sort
         if options["sortby"]:
-            sortindex = self._field_names.index(options["sortby"])
-            # Decorate
-            rows = [[row[sortindex]] + row for row in rows]
-            # Sort
-            rows.sort(reverse=options["reversesort"], key=options["sort_key"])
-            # Undecorate
-            rows = [row[1:] for row in rows]
+            end = options["end"]
+            if self._sort_index and not options["oldsortslice"] and not self._lazy_rows:
+                indices = self._get_indexed_order(options, keep)
+            else:
+                keys = self._get_sort_keys(
+                    options["sortby"], options["sort_key"], options["reversesort"]
+                )
+                key = keys.__getitem__
+                if (
+                    not options["oldsortslice"]
+                    and end is not None
+                    and end < len(indices)
+                ):
+                    # Only the rows up to end are printed, so pick those out rather
+                    # than sorting them all. nsmallest and nlargest give the same rows
+                    # in the same order as sorting and slicing, including ties.
+                    if options["reversesort"]:
+                        indices = heapq.nlargest(end, indices, key=key)
+                    else:
+                        indices = heapq.nsmallest(end, indices, key=key)
+                else:
+                    indices = sorted(indices, key=key, reverse=options["reversesort"])
 
         # Slice if necessary
         if not options["oldsortslice"]:
-            rows = rows[options["start"] : options["end"]]
+            indices = indices[options["start"] : options["end"]]
+
+        return indices
+
+    def _get_sort_keys(
+        self,
+        sortby: SortByType,
+        sort_key: Callable[[RowType], SupportsRichComparison],
+        reversesort: bool,
+    ) -> _RowCache:
+        """Return the key to sort each row of the table by.
+
+        The keys are kept between renders, so only those of rows added since the
+        last render are worked out."""
+        key = self._get_sort_cache_key(sortby, sort_key, reversesort)
+        if self._lazy_rows:
+            # The rows may have changed since the last render
+            self._sort_keys_key = None
+            self._sort_keys = _RowCache()
+        elif key != self._sort_keys_key:
+            self._sort_keys_key = key
+            self._sort_keys = _RowCache()
+        keys = self._sort_keys
+        if len(keys) < len(self._rows):
+            row_key = self._get_sort_key(key[0], sort_key, key[3])
+            rows = self._rows
+            if isinstance(rows, deque):
+                rows = list(rows)
+            for index in range(len(keys), len(rows)):
+                row = rows[index]
+                keys.append(row_key(row if isinstance(row, list) else list(row)))
+        return keys
+
+    def _get_sort_cache_key(
+        self,
+        sortby: SortByType,
+        sort_key: Callable[[RowType], SupportsRichComparison],
+        reversesort: bool,
+    ) -> tuple:
+        """Return what the sort keys of the rows depend on besides their values: the
+        sortby fields, sort_key, the column types of the fields, and for typed
+        fields whether the sort is reversed"""
+        fields = _sort_fields(sortby)
+        names = [fields] if isinstance(fields, str) else [f for f, _ in fields]
+        types = tuple(self._column_types.get(name) for name in names)
+        descending = reversesort and sort_key is _default_sort_key and any(types)
+        return (fields, sort_key, types, descending)
+
+    def _get_sort_key(
+        self,
+        sortby: str | tuple[tuple[str, bool], ...],
+        sort_key: Callable[[RowType], SupportsRichComparison],
+        descending: bool = False,
+    ) -> Callable[[RowType], SupportsRichComparison]:
+        """Return the function giving the key to sort a row by. Missing values of
+        typed columns are put last, so their keys depend on whether the sort is
+        descending."""
+        if not isinstance(sortby, str):
+            return self._get_fields_sort_key(sortby, sort_key, descending)
+        sortindex = self._field_names.index(sortby)
+        if sort_key is _default_sort_key and sortby in self._column_types:
+            # The values of a typed column can be compared directly. Rows with
+            # equal values are left in the order of the table, as the rest of the
+            # row may hold missing values of other typed columns, which can't be
+            # compared.
+            def typed_key(row: RowType) -> SupportsRichComparison:
+                value = row[sortindex]
+                return ((value is None) != descending, value)
+
+            return typed_key
+
+        if sort_key is _default_sort_key:
+            # Orders the rows the same as the decorated row, without copying it
+            def value_key(row: RowType) -> SupportsRichComparison:
+                return (row[sortindex], row)
+
+            return value_key
+
+        def key(row: RowType) -> SupportsRichComparison:
+            # sort_key sees the row decorated with the value of the sortby field
+            return sort_key([row[sortindex]] + row)
+
+        return key
+
+    def _get_fields_sort_key(
+        self,
+        sortby: tuple[tuple[str, bool], ...],
+        sort_key: Callable[[RowType], SupportsRichComparison],
+        descending: bool,
+    ) -> Callable[[RowType], SupportsRichComparison]:
+        """Return the function giving the key to sort a row by several fields, a
+        tuple with sort_key applied to the value of each field"""
+        columns = [
+            (
+                self._field_names.index(field),
+                sort_key is _default_sort_key and field in self._column_types,
+                reverse,
+            )
+            for field, reverse in sortby
+        ]
+
+        def key(row: RowType) -> SupportsRichComparison:
+            keys: list[Any] = []
+            for index, typed, reverse in columns:
+                value = row[index]
+                # Missing values of a typed column go last, whichever way it is
+                # sorted
+                value_key = (
+                    ((value is None) != (reverse != descending), value)
+                    if typed
+                    else sort_key(value)
+                )
+                keys.append(_Reversed(value_key) if reverse else value_key)
+            return tuple(keys)
+
+        return key
 
-        return rows
+    def _get_indexed_order(self, options, keep: set[int] | None = None) -> list[int]:
+        """Return the indices of the rows in sorted order, up to end, from the sort
+        index, which is built first if there isn't one for the sortby and sort_key
+        of the options. Only the rows in keep are returned, if given."""
+        index_key = self._get_sort_cache_key(
+            options["sortby"], options["sort_key"], options["reversesort"]
+        )
+        if self._index_key != index_key:
+            keys = self._get_sort_keys(
+                options["sortby"], options["sort_key"], options["reversesort"]
+            )
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            self._drop_sort_index()
+            self._index_keys = [keys[i] for i in order]
+            self._index_rows = order
+            self._index_key = index_key
+
+        end = options["end"]
+        if end is None:
+            end = len(self._index_rows)
+        if not options["reversesort"]:
+            if keep is None and not self._index_stale and not self._index_removed:
+                return self._index_rows[:end]
+            return list(islice(self._get_index_rows(self._index_rows, keep), end))
+        # Walk back from the largest key, keeping rows with equal keys in the order
+        # of the table as sorting with reverse=True does
+        index_keys = self._index_keys
+        indices: list[int] = []
+        stop = len(index_keys)
+        while stop and len(indices) < end:
+            start = bisect_left(index_keys, index_keys[stop - 1], 0, stop)
+            indices.extend(self._get_index_rows(self._index_rows[start:stop], keep))
+            stop = start
+        return indices
+
+    def _filter_rows(self, row_filter: RowFilterType) -> list[int]:
+        """Return the indices of the rows that row_filter keeps, in table order.
+
+        A dictionary of field names and values keeps the rows holding all of those
+        values. The rows holding the value of a filter_index column are looked up
+        in its index, so only those are checked against the rest."""
+        rows = self._rows
+        if not isinstance(row_filter, Mapping):
+            return [
+                index
+                for index, row in enumerate(rows)
+                if row_filter(row if isinstance(row, list) else list(row))
+            ]
+
+        conditions = [
+            (self._field_names.index(field), value)
+            for field, value in row_filter.items()
+        ]
+
+        def matches(row: RowType) -> bool:
+            return all(row[column] == value for column, value in conditions)
+
+        candidates = None
+        if self._filter_index and not self._lazy_rows:
+            self._update_filter_indexes()
+            for field, value in row_filter.items():
+                if (values := self._filter_indexes.get(field)) is None:
+                    continue
+                try:
+                    positions = values.get(value, [])
+                except TypeError:
+                    continue
+                offset = self._filter_offset
+                found = [
+                    position - offset
+                    for position in positions[bisect_left(positions, offset) :]
+                ]
+                if candidates is None or len(found) < len(candidates):
+                    candidates = found
+        if candidates is None:
+            return [index for index, row in enumerate(rows) if matches(row)]
+        return [index for index in candidates if matches(rows[index])]
+
+    def _get_rows(self, options, indices: Sequence[int] | None = None) -> list[RowType]:
+        """Return only those data rows that should be printed, based on slicing and
+        sorting.
 
-    def _get_dividers(self, options) -> list[bool]:
-        """Return only those dividers that should be printed, based on slicing.
+        The rows returned are the stored rows themselves, not copies, so callers
+        must not modify them in place.
 
         Arguments:
 
-        options - dictionary of option settings."""
-        import copy
+        options - dictionary of option settings.
+        indices - indices of the rows, if already known from _get_row_indices"""
+
+        if indices is None:
+            indices = self._get_row_indices(options)
+        rows = self._rows
+        if isinstance(rows, _ColumnStore):
+            return rows.take(indices)
+        if self._lazy_rows:
+            return [self._check_row(list(rows[i])) for i in indices]
+        if isinstance(rows, deque):
+            # Indexing a deque is slow away from its ends
+            rows = list(rows)
+        return [rows[i] for i in indices]
+
+    def _get_dividers(self, options, indices: Sequence[int]) -> set[int]:
+        """Return the positions among the printed rows of those followed by a
+        divider, based on slicing and filtering. Sorted tables have no dividers.
 
-        if options["oldsortslice"]:
-            dividers = copy.deepcopy(self._dividers[options["start"] : options["end"]])
+        Arguments:
+
+        options - dictionary of option settings
+        indices - indices of the printed rows, from _get_row_indices"""
+
+        if options["sortby"] or not self._dividers:
+            return set()
+        if options["row_filter"] is not None:
+            dividers = set(self._dividers)
+            return {
+                position for position, index in enumerate(indices) if index in dividers
+            }
+        printed = range(len(self._rows))[options["start"] : options["end"]]
+        first = bisect_left(self._dividers, printed.start)
+        stop = bisect_left(self._dividers, printed.stop, first)
+        return {index - printed.start for index in self._dividers[first:stop]}
+
+    def _get_formatters(self) -> list[Callable[[Any], str]]:
+        """Return the function formatting the values of each column.
+
+        They are picked once per column: when the type of a column is known, or
+        it has no int_format or float_format, values don't have to be checked one
+        by one for which format applies to them."""
+        formatters: list[Callable[[Any], str]] = []
+        for field in self._field_names:
+            column_type = self._column_types.get(field)
+            custom = self._custom_format.get(field)
+            fallback = functools.partial(custom, field) if custom else str
+            if column_type in (int, bool) and field in self._int_format:
+                formatter = _format_with(f"%{self._int_format[field]}d", fallback)
+            elif column_type is float and field in self._float_format:
+                formatter = _format_with(f"%{self._float_format[field]}f", fallback)
+            elif column_type is None and (
+                field in self._int_format or field in self._float_format
+            ):
+                formatter = functools.partial(self._format_value, field)
+            else:
+                formatter = fallback
+            formatters.append(formatter)
+        return formatters
+
+    def _format_rows(
+        self,
+        rows: list[RowType],
+        indices: Sequence[int] | None = None,
+        executor: Executor | None = None,
+    ) -> list[list[str]]:
+        """Return the rows with all their values formatted as strings.
+
+        If the indices of the rows in the table are given, rows formatted by an
+        earlier call are taken from the cache instead of being formatted again.
+        The returned rows may be the cached ones, so must not be modified in place.
+
+        Arguments:
+
+        rows - rows to format
+        indices - position of each of the rows in the table
+        executor - executor to split the formatting of many rows across"""
+
+        if indices is None or self._lazy_rows:
+            return self._format_new_rows(rows, executor)
+
+        key = self._get_format_key()
+        if key != self._format_key:
+            self._format_key = key
+            self._formatted_rows = _RowCache()
+        cache = self._formatted_rows
+        if len(cache) < len(self._rows):
+            cache.extend([None] * (len(self._rows) - len(cache)))
+
+        missing = [i for i, index in enumerate(indices) if cache[index] is None]
+        if missing:
+            if executor is None and isinstance(self._rows, _ColumnStore):
+                formatted = self._format_columns([indices[i] for i in missing])
+            else:
+                formatted = self._format_new_rows([rows[i] for i in missing], executor)
+            for i, formatted_row in zip(missing, formatted):
+                cache[indices[i]] = formatted_row
+        return [row for index in indices if (row := cache[index]) is not None]
+
+    def _format_columns(self, indices: Sequence[int]) -> list[list[str]]:
+        """Format the rows at the given indices of a columnar table a column at a
+        time, so that the format of each column only needs to be looked up once."""
+        assert isinstance(self._rows, _ColumnStore)
+        if not self._field_names:
+            return [[] for _ in indices]
+
+        indices = self._rows.positions(indices)
+        columns = []
+        for field, column, formatter in zip(
+            self._field_names, self._rows.columns, self._get_formatters()
+        ):
+            if isinstance(column, _CategoryColumn):
+                columns.append(column.format(formatter, indices))
+                continue
+            if not isinstance(column, list):
+                formatted = self._format_array(field, column[list(indices)])
+                if formatted is not None:
+                    columns.append(formatted)
+                    continue
+            columns.append(list(map(formatter, self._rows.gather(column, indices))))
+        return [list(row) for row in zip(*columns)]
+
+    def _format_array(self, field: str, array: Any) -> list[str] | None:
+        """Format a NumPy array of integers or floats with int_format or
+        float_format in one go, or return None if the values of the array have to
+        be formatted one by one."""
+        kind = array.dtype.kind
+        if kind in "iu" and field in self._int_format:
+            fmt = f"%{self._int_format[field]}d"
+        elif kind == "f" and field in self._float_format:
+            fmt = f"%{self._float_format[field]}f"
         else:
-            dividers = copy.deepcopy(self._dividers)
+            return None
 
-        if options["sortby"]:
-            dividers = [False for divider in dividers]
+        import numpy as np
 
-        return dividers
+        return np.char.mod(fmt, array).tolist()
 
-    def _format_row(self, row: RowType) -> list[str]:
-        return [
-            self._format_value(field, value)
-            for (field, value) in zip(self._field_names, row)
+    def _format_new_rows(
+        self, rows: list[RowType], executor: Executor | None = None
+    ) -> list[list[str]]:
+        if executor is None or len(rows) <= FORMAT_CHUNK_SIZE:
+            formatters = self._get_formatters()
+            return [
+                [formatter(value) for formatter, value in zip(formatters, row)]
+                for row in rows
+            ]
+
+        # Hand the formatting options over rather than the table itself, so that
+        # process pools don't have to pickle all of the rows for every chunk
+        format_chunk = functools.partial(
+            _format_chunk,
+            self._field_names,
+            self._int_format,
+            self._float_format,
+            self._custom_format,
+        )
+        chunks = [
+            rows[i : i + FORMAT_CHUNK_SIZE]
+            for i in range(0, len(rows), FORMAT_CHUNK_SIZE)
         ]
+        return [row for chunk in executor.map(format_chunk, chunks) for row in chunk]
+
+    def _get_format_key(self) -> tuple:
+        """Return the settings that the formatted values of the rows depend on.
+
+        Values formatted by an earlier render are only reused while this is
+        unchanged. The option dictionaries can be modified in place, so their
+        contents are compared rather than tracked through the property setters."""
+        return (
+            tuple(self._field_names),
+            tuple(self._int_format.items()),
+            tuple(self._float_format.items()),
+            tuple(self._custom_format.items()),
+        )
+
+    def _row_caches_valid(self) -> bool:
+        """Whether the formatted values and widths kept for the rows are up to date,
+        so that a change to the columns can be applied to them rather than throwing
+        them away"""
+        return (
+            not self._lazy_rows
+            and self._format_key == self._get_format_key()
+            and self._width_key == self._get_width_key()
+        )
 
-    def _format_rows(self, rows: list[RowType]) -> list[list[str]]:
-        return [self._format_row(row) for row in rows]
+    def _reset_row_caches(self) -> None:
+        """Forget the formatted values, widths and sorted order kept for the rows,
+        after a change that affects all of them"""
+        self._format_key = None
+        self._width_key = None
+        self._drop_sort_keys()
+        self._drop_filter_indexes()
 
     ##############################
     # PLAIN TEXT STRING METHODS  #
@@ -1888,74 +3920,102 @@ class PrettyTable:
             single character string used to draw bottom-left line junctions
         sortby - name of field to sort rows by
         sort_key - sorting key function, applied to data points before sorting
+        row_filter - function or dictionary of field values choosing rows to print
         reversesort - True or False to sort in descending or ascending order
         print empty - if True, stringify just the header for an empty table,
-            if False return an empty string"""
+            if False return an empty string
+        width_estimate - size columns from a sample of about this many rows
+        format_executor - concurrent.futures executor used to format large tables"""
 
-        options = self._get_options(kwargs)
+        return "\n".join(self.iter_lines(**kwargs))
 
-        lines: list[str] = []
+    def iter_lines(self, **kwargs) -> Iterator[str]:
+        """Return an iterator over the lines of the string representation of the
+        table in current state.
+
+        Takes the same keyword arguments as get_string, and joining the yielded
+        lines with newlines gives the same result as get_string. Lines are
+        generated one at a time rather than collected in a list, which keeps
+        memory usage down when writing out very large tables."""
+
+        options = self._get_options(kwargs)
 
         # Don't think too hard about an empty table
         # Is this the desired behaviour?  Maybe we should still print the header?
         if self.rowcount == 0 and (not options["print_empty"] or not options["border"]):
-            return ""
+            return
+
+        orgmode = "orgmode" in self.__dict__ and self.orgmode
+        for block in self._iter_blocks(options):
+            for line in block.split("\n"):
+                if orgmode:
+                    line = "|" + line[1:-1] + "|"
+                yield line
+
+    def _iter_blocks(self, options) -> Iterator[str]:
+        """Yield the title, header, rows and rules of the table one at a time. A
+        single block may span several lines."""
 
         # Get the rows we need to print, taking into account slicing, sorting, etc.
-        rows = self._get_rows(options)
-        dividers = self._get_dividers(options)
+        indices = self._get_row_indices(options)
+        rows = self._get_rows(options, indices)
+        dividers = self._get_dividers(options, indices)
 
         # Turn all data in all rows into Unicode, formatted as desired
-        formatted_rows = self._format_rows(rows)
+        formatted_rows = self._format_rows(rows, indices, options["format_executor"])
 
         # Compute column widths
-        self._compute_widths(formatted_rows, options)
-        self._hrule = self._stringify_hrule(options)
+        self._compute_widths(formatted_rows, options, indices)
+        self._width_overflow = 0
+        layout = self._get_layout(options)
+        self._hrule = layout.hrule
 
         # Add title
         title = options["title"] or self._title
         if title:
-            lines.append(self._stringify_title(title, options))
+            yield self._stringify_title(title, options)
 
         # Add header or top of border
         if options["header"]:
-            lines.append(self._stringify_header(options))
+            yield self._stringify_header(options)
         elif options["border"] and options["hrules"] in (
             HRuleStyle.ALL,
             HRuleStyle.FRAME,
         ):
-            lines.append(self._stringify_hrule(options, where="top_"))
+            top = layout.top_hrule
             if title and options["vrules"] in (VRuleStyle.ALL, VRuleStyle.FRAME):
-                lines[-1] = (
-                    self.left_junction_char + lines[-1][1:-1] + self.right_junction_char
-                )
+                top = self.left_junction_char + top[1:-1] + self.right_junction_char
+            yield top
 
         # Add rows
-        for row, divider in zip(formatted_rows[:-1], dividers[:-1]):
-            lines.append(self._stringify_row(row, options, self._hrule))
-            if divider:
-                lines.append(self._stringify_hrule(options, where="bottom_"))
+        for position, row in enumerate(formatted_rows[:-1]):
+            yield self._stringify_row(row, options, layout.hrule, layout)
+            if position in dividers:
+                yield layout.bottom_hrule
         if formatted_rows:
-            lines.append(
-                self._stringify_row(
-                    formatted_rows[-1],
-                    options,
-                    self._stringify_hrule(options, where="bottom_"),
-                )
+            yield self._stringify_row(
+                formatted_rows[-1], options, layout.bottom_hrule, layout
             )
 
         # Add bottom of border
         if options["border"] and options["hrules"] == HRuleStyle.FRAME:
-            lines.append(self._stringify_hrule(options, where="bottom_"))
-
-        if "orgmode" in self.__dict__ and self.orgmode:
-            lines = [
-                "|" + new_line[1:-1] + "|"
-                for old_line in lines
-                for new_line in old_line.split("\n")
-            ]
-
-        return "\n".join(lines)
+            yield layout.bottom_hrule
+
+    def _get_layout(self, options) -> _RenderLayout:
+        """Return the layout for the current options and column widths, compiling a
+        new one only if they differ from those of the cached layout."""
+        key = (
+            tuple(options[option] for option in _LAYOUT_OPTIONS),
+            tuple(self._field_names),
+            tuple(self._widths),
+            tuple(self._align.items()),
+            tuple(self._valign.items()),
+            self.vertical_char,
+            self._horizontal_align_char,
+        )
+        if self._layout is None or self._layout.key != key:
+            self._layout = _RenderLayout(self, options, key)
+        return self._layout
 
     def _stringify_hrule(
         self, options, where: Literal["top_", "bottom_", ""] = ""
@@ -2096,15 +4156,22 @@ class PrettyTable:
             bits.append(self._hrule)
         return "".join(bits)
 
-    def _stringify_row(self, row: list[str], options, hrule: str) -> str:
+    def _stringify_row(
+        self,
+        row: list[str],
+        options,
+        hrule: str,
+        layout: _RenderLayout | None = None,
+    ) -> str:
         import textwrap
 
-        for index, field, value, width in zip(
-            range(0, len(row)), self._field_names, row, self._widths
-        ):
+        # The formatted row may be cached, so build a new one instead of changing it
+        values: list[str] = []
+        for field, value, width in zip(self._field_names, row, self._widths):
             # Enforce max widths
             lines = value.split("\n")
             new_lines: list[str] = []
+            overflow = False
             for line in lines:
                 if (
                     line == "None"
@@ -2113,77 +4180,56 @@ class PrettyTable:
                     line = none_val
                 if _str_block_width(line) > width:
                     line = textwrap.fill(line, width)
+                    overflow = True
                 new_lines.append(line)
-            lines = new_lines
-            value = "\n".join(lines)
-            row[index] = value
-
-        row_height = 0
-        for c in row:
-            h = _get_size(c)[1]
-            if h > row_height:
-                row_height = h
-
-        bits: list[list[str]] = []
-        lpad, rpad = self._get_padding_widths(options)
-        for y in range(0, row_height):
-            bits.append([])
-            if options["border"]:
-                if options["vrules"] in (VRuleStyle.ALL, VRuleStyle.FRAME):
-                    bits[y].append(self.vertical_char)
-                else:
-                    bits[y].append(" ")
-
-        for field, value, width in zip(self._field_names, row, self._widths):
-            valign = self._valign[field]
-            lines = value.split("\n")
-            d_height = row_height - len(lines)
-            if d_height:
-                if valign == "m":
-                    lines = (
-                        [""] * int(d_height / 2)
-                        + lines
-                        + [""] * (d_height - int(d_height / 2))
-                    )
-                elif valign == "b":
-                    lines = [""] * d_height + lines
-                else:
-                    lines = lines + [""] * d_height
-
-            for y, line in enumerate(lines):
-                if options["fields"] and field not in options["fields"]:
-                    continue
-
-                bits[y].append(
-                    " " * lpad
-                    + self._justify(line, width, self._align[field])
-                    + " " * rpad
-                )
-                if options["border"] or options["preserve_internal_border"]:
-                    if options["vrules"] == VRuleStyle.ALL:
-                        bits[y].append(self.vertical_char)
+            values.append("\n".join(new_lines))
+            self._width_overflow += overflow
+        row = values
+
+        row_height = max((value.count("\n") + 1 for value in row), default=0)
+
+        if layout is None:
+            layout = self._get_layout(options)
+        lpad, rpad = layout.lpad, layout.rpad
+        justify = self._justify
+        if row_height == 1:
+            line = layout.separator.join(
+                [
+                    lpad + justify(row[index], width, align) + rpad
+                    for index, field, width, align, valign in layout.columns
+                ]
+            )
+            bits = [layout.start + line + layout.last_end]
+        else:
+            columns: list[list[str]] = []
+            for index, field, width, align, valign in layout.columns:
+                lines = row[index].split("\n")
+                d_height = row_height - len(lines)
+                if d_height:
+                    if valign == "m":
+                        lines = (
+                            [""] * int(d_height / 2)
+                            + lines
+                            + [""] * (d_height - int(d_height / 2))
+                        )
+                    elif valign == "b":
+                        lines = [""] * d_height + lines
                     else:
-                        bits[y].append(" ")
-
-        # If only preserve_internal_border is true, then we just appended
-        # a vertical character at the end when we wanted a space
-        if not options["border"] and options["preserve_internal_border"]:
-            bits[-1].pop()
-            bits[-1].append(" ")
-
-        # If vrules is FRAME, then we just appended a space at the end
-        # of the last field, when we really want a vertical character
-        for y in range(0, row_height):
-            if options["border"] and options["vrules"] == VRuleStyle.FRAME:
-                bits[y].pop()
-                bits[y].append(options["vertical_char"])
+                        lines = lines + [""] * d_height
+                columns.append(
+                    [lpad + justify(line, width, align) + rpad for line in lines]
+                )
+            bits = [
+                layout.start
+                + layout.separator.join(cells)
+                + (layout.last_end if y == row_height - 1 else layout.end)
+                for y, cells in enumerate(zip(*columns))
+            ]
 
-        if options["border"] and options["hrules"] == HRuleStyle.ALL:
-            bits[row_height - 1].append("\n")
-            bits[row_height - 1].append(hrule)
+        if layout.hrule_after_row and bits:
+            bits[-1] += "\n" + hrule
 
-        bits_str = ["".join(bits_y) for bits_y in bits]
-        return "\n".join(bits_str)
+        return "\n".join(bits)
 
     def paginate(self, page_length: int = 58, line_break: str = "\f", **kwargs) -> str:
         pages: list[str] = []
@@ -2209,14 +4255,18 @@ class PrettyTable:
         header as a PrettyTable formatting option (skip the header row) and
         delimiter as a csv.writer keyword argument.
         """
+        csv_buffer = io.StringIO()
+        self._write_csv(csv_buffer, **kwargs)
+        return csv_buffer.getvalue()
+
+    def _write_csv(self, fp, **kwargs) -> None:
         import csv
 
         options = self._get_options(kwargs)
         csv_options = {
             key: value for key, value in kwargs.items() if key not in options
         }
-        csv_buffer = io.StringIO()
-        csv_writer = csv.writer(csv_buffer, **csv_options)
+        csv_writer = csv.writer(fp, **csv_options)
 
         if options.get("header"):
             if options["fields"]:
@@ -2235,8 +4285,6 @@ class PrettyTable:
         for row in rows:
             csv_writer.writerow(row)
 
-        return csv_buffer.getvalue()
-
     ##############################
     # JSON STRING METHODS        #
     ##############################
@@ -2251,6 +4299,14 @@ class PrettyTable:
         """
         import json
 
+        objects, json_options = self._get_json_objects(kwargs)
+        return json.dumps(objects, **json_options)
+
+    def _get_json_objects(
+        self, kwargs
+    ) -> tuple[list[list[str] | dict[str, Any]], dict[str, Any]]:
+        """Return the objects to serialise and the keyword arguments for the json
+        module, split out of kwargs."""
         options = self._get_options(kwargs)
         json_options: dict[str, Any] = {
             "indent": 4,
@@ -2281,7 +4337,7 @@ class PrettyTable:
             for row in rows:
                 objects.append(dict(zip(self._field_names, row)))
 
-        return json.dumps(objects, **json_options)
+        return objects, json_options
 
     ##############################
     # HTML STRING METHODS        #
@@ -2315,6 +4371,7 @@ class PrettyTable:
         right_padding_width - number of spaces on right hand side of column data
         sortby - name of field to sort rows by
         sort_key - sorting key function, applied to data points before sorting
+        row_filter - function or dictionary of field values choosing rows to print
         attributes - dictionary of name/value pairs to include as HTML attributes in the
             <table> tag
         format - Controls whether or not HTML tables are formatted to match
@@ -2323,18 +4380,16 @@ class PrettyTable:
         xhtml - print <br/> tags if True, <br> tags if False"""
 
         options = self._get_options(kwargs)
+        return "\n".join(self._iter_html_lines(options))
 
+    def _iter_html_lines(self, options) -> Iterator[str]:
         if options["format"]:
-            string = self._get_formatted_html_string(options)
-        else:
-            string = self._get_simple_html_string(options)
+            return self._iter_formatted_html_lines(options)
+        return self._iter_simple_html_lines(options)
 
-        return string
-
-    def _get_simple_html_string(self, options) -> str:
+    def _iter_simple_html_lines(self, options) -> Iterator[str]:
         from html import escape
 
-        lines: list[str] = []
         if options["xhtml"]:
             linebreak = "<br/>"
         else:
@@ -2345,55 +4400,53 @@ class PrettyTable:
             for attr_name, attr_value in options["attributes"].items():
                 open_tag.append(f' {escape(attr_name)}="{escape(attr_value)}"')
         open_tag.append(">")
-        lines.append("".join(open_tag))
+        yield "".join(open_tag)
 
         # Title
         title = options["title"] or self._title
         if title:
-            lines.append(f"    <caption>{escape(title)}</caption>")
+            yield f"    <caption>{escape(title)}</caption>"
 
         # Headers
         if options["header"]:
-            lines.append("    <thead>")
-            lines.append("        <tr>")
+            yield "    <thead>"
+            yield "        <tr>"
             for field in self._field_names:
                 if options["fields"] and field not in options["fields"]:
                     continue
                 if options["escape_header"]:
                     field = escape(field)
 
-                lines.append(
-                    "            <th>{}</th>".format(field.replace("\n", linebreak))
-                )
+                yield "            <th>{}</th>".format(field.replace("\n", linebreak))
 
-            lines.append("        </tr>")
-            lines.append("    </thead>")
+            yield "        </tr>"
+            yield "    </thead>"
 
         # Data
-        lines.append("    <tbody>")
-        rows = self._get_rows(options)
-        formatted_rows = self._format_rows(rows)
+        yield "    <tbody>"
+        indices = self._get_row_indices(options)
+        rows = self._get_rows(options, indices)
+        formatted_rows = self._format_rows(rows, indices, options["format_executor"])
+        escape_category = _memoized(escape)
         for row in formatted_rows:
-            lines.append("        <tr>")
+            yield "        <tr>"
             for field, datum in zip(self._field_names, row):
                 if options["fields"] and field not in options["fields"]:
                     continue
                 if options["escape_data"]:
-                    datum = escape(datum)
-
-                lines.append(
-                    "            <td>{}</td>".format(datum.replace("\n", linebreak))
-                )
-            lines.append("        </tr>")
-        lines.append("    </tbody>")
-        lines.append("</table>")
+                    if field in self._categorical:
+                        datum = escape_category(datum)
+                    else:
+                        datum = escape(datum)
 
-        return "\n".join(lines)
+                yield "            <td>{}</td>".format(datum.replace("\n", linebreak))
+            yield "        </tr>"
+        yield "    </tbody>"
+        yield "</table>"
 
-    def _get_formatted_html_string(self, options) -> str:
+    def _iter_formatted_html_lines(self, options) -> Iterator[str]:
         from html import escape
 
-        lines: list[str] = []
         lpad, rpad = self._get_padding_widths(options)
         if options["xhtml"]:
             linebreak = "<br/>"
@@ -2431,34 +4484,35 @@ class PrettyTable:
             for attr_name, attr_value in options["attributes"].items():
                 open_tag.append(f' {escape(attr_name)}="{escape(attr_value)}"')
         open_tag.append(">")
-        lines.append("".join(open_tag))
+        yield "".join(open_tag)
 
         # Title
         title = options["title"] or self._title
         if title:
-            lines.append(f"    <caption>{escape(title)}</caption>")
+            yield f"    <caption>{escape(title)}</caption>"
 
         # Headers
         if options["header"]:
-            lines.append("    <thead>")
-            lines.append("        <tr>")
+            yield "    <thead>"
+            yield "        <tr>"
             for field in self._field_names:
                 if options["fields"] and field not in options["fields"]:
                     continue
                 if options["escape_header"]:
                     field = escape(field)
 
-                lines.append(
+                yield (
                     '            <th style="padding-left: %dem; padding-right: %dem; text-align: center">%s</th>'  # noqa: E501
                     % (lpad, rpad, field.replace("\n", linebreak))
                 )
-            lines.append("        </tr>")
-            lines.append("    </thead>")
+            yield "        </tr>"
+            yield "    </thead>"
 
         # Data
-        lines.append("    <tbody>")
-        rows = self._get_rows(options)
-        formatted_rows = self._format_rows(rows)
+        yield "    <tbody>"
+        indices = self._get_row_indices(options)
+        rows = self._get_rows(options, indices)
+        formatted_rows = self._format_rows(rows, indices, options["format_executor"])
         aligns: list[str] = []
         valigns: list[str] = []
         for field in self._field_names:
@@ -2468,17 +4522,21 @@ class PrettyTable:
             valigns.append(
                 {"t": "top", "m": "middle", "b": "bottom"}[self._valign[field]]
             )
+        escape_category = _memoized(escape)
         for row in formatted_rows:
-            lines.append("        <tr>")
+            yield "        <tr>"
             for field, datum, align, valign in zip(
                 self._field_names, row, aligns, valigns
             ):
                 if options["fields"] and field not in options["fields"]:
                     continue
                 if options["escape_data"]:
-                    datum = escape(datum)
+                    if field in self._categorical:
+                        datum = escape_category(datum)
+                    else:
+                        datum = escape(datum)
 
-                lines.append(
+                yield (
                     '            <td style="padding-left: %dem; padding-right: %dem; text-align: %s; vertical-align: %s">%s</td>'  # noqa: E501
                     % (
                         lpad,
@@ -2488,11 +4546,9 @@ class PrettyTable:
                         datum.replace("\n", linebreak),
                     )
                 )
-            lines.append("        </tr>")
-        lines.append("    </tbody>")
-        lines.append("</table>")
-
-        return "\n".join(lines)
+            yield "        </tr>"
+        yield "    </tbody>"
+        yield "</table>"
 
     ##############################
     # LATEX STRING METHODS       #
@@ -2519,19 +4575,19 @@ class PrettyTable:
         float_format - controls formatting of floating point data
         sortby - name of field to sort rows by
         sort_key - sorting key function, applied to data points before sorting
+        row_filter - function or dictionary of field values choosing rows to print
         format - Controls whether or not HTML tables are formatted to match
             styling options (True or False)
         """
         options = self._get_options(kwargs)
+        return "\r\n".join(self._iter_latex_lines(options))
 
+    def _iter_latex_lines(self, options) -> Iterator[str]:
         if options["format"]:
-            string = self._get_formatted_latex_string(options)
-        else:
-            string = self._get_simple_latex_string(options)
-        return string
+            return self._iter_formatted_latex_lines(options)
+        return self._iter_simple_latex_lines(options)
 
-    def _get_simple_latex_string(self, options) -> str:
-        lines: list[str] = []
+    def _iter_simple_latex_lines(self, options) -> Iterator[str]:
 
         wanted_fields = []
         if options["fields"]:
@@ -2544,27 +4600,25 @@ class PrettyTable:
         alignments = "".join([self._align[field] for field in wanted_fields])
 
         begin_cmd = f"\\begin{{tabular}}{{{alignments}}}"
-        lines.append(begin_cmd)
+        yield begin_cmd
 
         # Headers
         if options["header"]:
-            lines.append(" & ".join(wanted_fields) + " \\\\")
+            yield " & ".join(wanted_fields) + " \\\\"
 
         # Data
-        rows = self._get_rows(options)
-        formatted_rows = self._format_rows(rows)
+        indices = self._get_row_indices(options)
+        rows = self._get_rows(options, indices)
+        formatted_rows = self._format_rows(rows, indices, options["format_executor"])
         for row in formatted_rows:
             wanted_data = [
                 d for f, d in zip(self._field_names, row) if f in wanted_fields
             ]
-            lines.append(" & ".join(wanted_data) + " \\\\")
+            yield " & ".join(wanted_data) + " \\\\"
 
-        lines.append("\\end{tabular}")
+        yield "\\end{tabular}"
 
-        return "\r\n".join(lines)
-
-    def _get_formatted_latex_string(self, options) -> str:
-        lines: list[str] = []
+    def _iter_formatted_latex_lines(self, options) -> Iterator[str]:
 
         wanted_fields: list[str] = []
         if options["fields"]:
@@ -2589,39 +4643,37 @@ class PrettyTable:
             alignment_str = "|" + alignment_str + "|"
 
         begin_cmd = f"\\begin{{tabular}}{{{alignment_str}}}"
-        lines.append(begin_cmd)
+        yield begin_cmd
         if options["border"] and options["hrules"] in [
             HRuleStyle.ALL,
             HRuleStyle.FRAME,
         ]:
-            lines.append("\\hline")
+            yield "\\hline"
 
         # Headers
         if options["header"]:
-            lines.append(" & ".join(wanted_fields) + " \\\\")
+            yield " & ".join(wanted_fields) + " \\\\"
         if (options["border"] or options["preserve_internal_border"]) and options[
             "hrules"
         ] in [HRuleStyle.ALL, HRuleStyle.HEADER]:
-            lines.append("\\hline")
+            yield "\\hline"
 
         # Data
-        rows = self._get_rows(options)
-        formatted_rows = self._format_rows(rows)
-        rows = self._get_rows(options)
+        indices = self._get_row_indices(options)
+        rows = self._get_rows(options, indices)
+        formatted_rows = self._format_rows(rows, indices, options["format_executor"])
         for row in formatted_rows:
             wanted_data = [
                 d for f, d in zip(self._field_names, row) if f in wanted_fields
             ]
-            lines.append(" & ".join(wanted_data) + " \\\\")
+            yield " & ".join(wanted_data) + " \\\\"
             if options["border"] and options["hrules"] == HRuleStyle.ALL:
-                lines.append("\\hline")
+                yield "\\hline"
 
         if options["border"] and options["hrules"] == HRuleStyle.FRAME:
-            lines.append("\\hline")
+            yield "\\hline"
 
-        lines.append("\\end{tabular}")
-
-        return "\r\n".join(lines)
+        yield "\\end{tabular}"
 
 
 ##############################
@@ -2629,12 +4681,50 @@ class PrettyTable:
 ##############################
 
 
-def _str_block_width(val: str) -> int:
+# Tables tend to repeat the same strings many times over, so the display width of
+# recently measured strings is memoized.
+WIDTH_CACHE_SIZE: Final = 4096
+
+
+def _compute_str_block_width(val: str) -> int:
     import wcwidth  # type: ignore[import-untyped]
 
     return wcwidth.wcswidth(_re.sub("", val))
 
 
+_cached_str_block_width = functools.lru_cache(maxsize=WIDTH_CACHE_SIZE)(
+    _compute_str_block_width
+)
+
+
+def _str_block_width(val: str) -> int:
+    if val.isascii() and val.isprintable():
+        # Printable ASCII characters are always one column wide, and there are no
+        # escape sequences to strip
+        return len(val)
+    return _cached_str_block_width(val)
+
+
+def set_width_cache_size(maxsize: int | None = WIDTH_CACHE_SIZE) -> None:
+    """Set the number of strings whose display width is memoized.
+
+    Arguments:
+
+    maxsize - maximum number of cached strings, 0 to disable caching or None for
+        an unbounded cache. Changing the size empties the cache."""
+    global _cached_str_block_width
+    _cached_str_block_width = functools.lru_cache(maxsize=maxsize)(
+        _compute_str_block_width
+    )
+
+
+def width_cache_info() -> functools._CacheInfo:
+    """Return the hits, misses, maxsize and currsize of the display width cache
+
+    Plain ASCII strings are measured directly and never enter the cache."""
+    return _cached_str_block_width.cache_info()
+
+
 ##############################
 # TABLE FACTORIES            #
 ##############################
@@ -2669,8 +4759,7 @@ def from_csv(fp, field_names: Sequence[str] | None = None, **kwargs) -> PrettyTa
     else:
         table.field_names = [x.strip() for x in next(reader)]
 
-    for row in reader:
-        table.add_row([x.strip() for x in row])
+    table.add_rows([[x.strip() for x in row] for row in reader], copy=False)
 
     return table
 
@@ -2679,8 +4768,7 @@ def from_db_cursor(cursor: Cursor, **kwargs) -> PrettyTable | None:
     if cursor.description:
         table = PrettyTable(**kwargs)
         table.field_names = [col[0] for col in cursor.description]
-        for row in cursor.fetchall():
-            table.add_row(row)
+        table.add_rows(cursor.fetchall())
         return table
     return None
 
@@ -2691,9 +4779,53 @@ def from_json(json_string: str | bytes, **kwargs) -> PrettyTable:
     table = PrettyTable(**kwargs)
     objects = json.loads(json_string)
     table.field_names = objects[0]
-    for obj in objects[1:]:
-        row = [obj[key] for key in table.field_names]
-        table.add_row(row)
+    table.add_rows(
+        [[obj[key] for key in table.field_names] for obj in objects[1:]], copy=False
+    )
+    return table
+
+
+def from_sequence(
+    rows: Sequence[Sequence[Any]], field_names: Sequence[str] | None = None, **kwargs
+) -> PrettyTable:
+    """Return a table which reads its rows from a sequence, without copying it.
+
+    rows can be any object with __len__ and __getitem__, which are only used to
+    get the rows that are printed, as they are printed. Without sortby, printing
+    a slice of the table only gets the rows in the slice. The rows are copied into
+    the table when rows or columns are added or deleted."""
+    if not field_names:
+        field_names = [f"Field {n + 1}" for n in range(len(rows[0]) if rows else 0)]
+    table = PrettyTable(field_names, **kwargs)
+    table._rows = rows
+    table._lazy_rows = True
+    return table
+
+
+def from_numpy(data, field_names: Sequence[str] | None = None, **kwargs) -> PrettyTable:
+    """Return a columnar table of the data in NumPy arrays, without copying it.
+
+    data can be a two-dimensional array, a structured array or a sequence of
+    one-dimensional arrays, one per column. The field names of a structured array
+    are used unless field_names is given. Columns of integers and floats are
+    formatted with int_format and float_format a whole column at a time."""
+    names = getattr(getattr(data, "dtype", None), "names", None)
+    if names:
+        columns = [data[name] for name in names]
+    elif getattr(data, "ndim", None) == 2:
+        columns = list(data.T)
+    else:
+        columns = list(data)
+    if len({len(column) for column in columns}) > 1:
+        msg = "All columns must have the same length"
+        raise ValueError(msg)
+
+    if not field_names:
+        field_names = names or [f"Field {n + 1}" for n in range(len(columns))]
+    kwargs["columnar"] = True
+    table = PrettyTable(field_names, **kwargs)
+    table._rows = _ColumnStore(columns=columns)
+    table._encode_categories(table._rows)
     return table
 
 
@@ -56,6 +56,14 @@ class TestColorTable:
             == row_prettytable.get_string()
         )
 
+    def test_iter_lines(self, row_colortable: ColorTable) -> None:
+        lines = list(row_colortable.iter_lines())
+        assert "\n".join(lines) == row_colortable.get_string()
+        assert lines[-1].endswith(RESET_CODE)
+
+    def test_empty(self) -> None:
+        assert ColorTable(["A", "B"], print_empty=False).get_string() == RESET_CODE
+
     def test_theme_setter(self, color_theme: Theme) -> None:
         table1 = ColorTable(theme=color_theme)
 
@@ -4,6 +4,10 @@ import datetime as dt
 import io
 import random
 import sqlite3
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 from math import e, pi, sqrt
 from typing import Any
 
@@ -30,6 +34,8 @@ from prettytable import (
     from_html,
     from_html_one,
     from_json,
+    from_numpy,
+    from_sequence,
 )
 
 
@@ -297,6 +303,49 @@ class TestDeleteColumn:
         with pytest.raises(ValueError):
             table.del_column("City not-a-name")
 
+    def test_del_columns(self, city_data_prettytable: PrettyTable) -> None:
+        expected = PrettyTable(["City name", "Annual Rainfall"])
+        expected.add_rows([[row[0], row[3]] for row in city_data_prettytable.rows])
+
+        city_data_prettytable.align["Area"] = "l"
+        city_data_prettytable.int_format["Population"] = "08"
+        city_data_prettytable.del_columns(["Area", "Population"])
+        assert city_data_prettytable.get_string() == expected.get_string()
+        assert "Area" not in city_data_prettytable.align
+        assert "Population" not in city_data_prettytable.int_format
+
+    def test_del_columns_illegal_column(
+        self, city_data_prettytable: PrettyTable
+    ) -> None:
+        expected = city_data_prettytable.get_string()
+        with pytest.raises(ValueError):
+            city_data_prettytable.del_columns(["Area", "City not-a-name"])
+        assert city_data_prettytable.get_string() == expected
+
+
+class TestAddColumns:
+    def test_add_columns(self, city_data_prettytable: PrettyTable) -> None:
+        expected = city_data_prettytable.copy()
+        expected.add_column("Country", ["Australia"] * 7, align="l")
+        expected.add_column("Rank", list(range(1, 8)), align="l")
+
+        city_data_prettytable.add_columns(
+            {"Country": ["Australia"] * 7, "Rank": list(range(1, 8))}, align="l"
+        )
+        assert city_data_prettytable.rows == expected.rows
+        assert city_data_prettytable.get_string() == expected.get_string()
+
+    def test_empty_table(self) -> None:
+        table = PrettyTable()
+        table.add_columns({"A": [1, 2], "B": ["x", "y"]})
+        assert table.rows == [[1, "x"], [2, "y"]]
+
+    def test_wrong_length(self, city_data_prettytable: PrettyTable) -> None:
+        with pytest.raises(ValueError):
+            city_data_prettytable.add_columns({"Country": ["Australia"]})
+        with pytest.raises(ValueError):
+            PrettyTable().add_columns({"A": [1, 2], "B": [1]})
+
 
 @pytest.fixture(scope="function")
 def field_name_less_table() -> PrettyTable:
@@ -748,6 +797,95 @@ class TestSlicing:
         assert "Melbourne" in string
         assert "Perth" in string
 
+    def test_index(self, city_data_prettytable: PrettyTable) -> None:
+        assert city_data_prettytable[-1].rows == [["Perth", 5386, 1554769, 869.4]]
+        with pytest.raises(IndexError):
+            city_data_prettytable[7]
+
+    def test_slice_of_slice(self, city_data_prettytable: PrettyTable) -> None:
+        table = city_data_prettytable[1:6][::2]
+        assert [row[0] for row in table.rows] == ["Brisbane", "Hobart", "Melbourne"]
+
+    def test_slice_keeps_settings(self) -> None:
+        table = PrettyTable(
+            ["Name", "Count"],
+            column_types={"Count": int},
+            categorical=["Name"],
+            max_rows=5,
+            sort_index=True,
+            filter_index=["Name"],
+        )
+        table.add_rows([["a", 10], ["b", None], ["a", 9], ["c", 2]])
+        view = table[1:]
+        assert view.column_types == {"Count": int}
+        assert view.categorical == ["Name"]
+        assert view.max_rows == 5
+        assert view.sort_index
+        assert view.filter_index == ["Name"]
+        # Sorted as numbers with missing values last, like the table
+        assert view.get_csv_string(sortby="Count").splitlines()[1:] == [
+            "c,2",
+            "a,9",
+            "b,",
+        ]
+        view.add_row(["d", "4"])
+        assert view.rows[-1] == ["d", 4]
+
+    def test_slice_reads_parent_rows(self, city_data_prettytable: PrettyTable) -> None:
+        table = city_data_prettytable[2:4]
+        assert table._rows.rows is city_data_prettytable._rows
+        assert table.rows == city_data_prettytable.rows[2:4]
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda t: t.add_row(["Canberra", 814, 381488, 616.4]),
+            lambda t: t.del_row(2),
+            lambda t: t.add_column("Country", ["Australia"] * t.rowcount),
+            lambda t: t.add_autoindex(),
+            lambda t: t.del_column("Area"),
+            lambda t: setattr(t, "columnar", True),
+            lambda t: t.clear_rows(),
+        ],
+    )
+    def test_changes_not_shared(
+        self, city_data_prettytable: PrettyTable, change: Callable[[PrettyTable], None]
+    ) -> None:
+        table = city_data_prettytable[1:5]
+        nested = table[1:]
+        expected = table.get_string()
+        expected_nested = nested.get_string()
+
+        change(city_data_prettytable)
+        assert table.get_string() == expected
+        assert nested.get_string() == expected_nested
+
+        parent = city_data_prettytable.get_string()
+        change(table)
+        assert nested.get_string() == expected_nested
+        assert city_data_prettytable.get_string() == parent
+
+    def test_no_copy_without_slices(self, city_data_prettytable: PrettyTable) -> None:
+        rows = city_data_prettytable._rows
+        city_data_prettytable[:3].get_string()
+        city_data_prettytable.add_row(["Canberra", 814, 381488, 616.4])
+        assert city_data_prettytable._rows is rows
+
+        table = city_data_prettytable[:3]
+        city_data_prettytable.add_row(["Canberra", 814, 381488, 616.4])
+        assert city_data_prettytable._rows is not rows
+        assert table.rowcount == 3
+
+    def test_columnar(self, city_data_prettytable: PrettyTable) -> None:
+        city_data_prettytable.columnar = True
+        table = city_data_prettytable[-3:]
+        assert table.columnar
+        city_data_prettytable.del_column("Area")
+        assert table.field_names[1] == "Area"
+        table.add_row(["Canberra", 814, 381488, 616.4])
+        assert isinstance(table._rows, prettytable.prettytable._ColumnStore)
+        assert table.rowcount == 4
+
 
 class TestSorting:
     def test_sort_by_different_per_columns(
@@ -772,6 +910,30 @@ class TestSorting:
             backward_lines.reverse()
             assert forward_lines == backward_lines
 
+    @pytest.mark.parametrize("reversesort", [False, True])
+    @pytest.mark.parametrize("start, end", [(0, 3), (2, 5), (0, 0), (4, 40)])
+    def test_sort_window(self, reversesort: bool, start: int, end: int) -> None:
+        # Only the printed rows are picked out, but ties stay in table order
+        rows = [[i % 4, f"row {i}"] for i in range(20)]
+        table = PrettyTable(["Group", "Name"])
+        table.add_rows(rows)
+
+        def key(vals: list[Any]) -> Any:
+            return vals[0]
+
+        expected = PrettyTable(["Group", "Name"])
+        expected.add_rows(sorted(rows, key=key, reverse=reversesort)[start:end])
+        assert (
+            table.get_string(
+                sortby="Group",
+                sort_key=key,
+                reversesort=reversesort,
+                start=start,
+                end=end,
+            )
+            == expected.get_string()
+        )
+
     def test_sort_key(self, city_data_prettytable: PrettyTable) -> None:
         # Test sorting by length of city name
         def key(vals):
@@ -797,6 +959,14 @@ class TestSorting:
 """.strip()
         )
 
+    def test_sort_does_not_modify_rows(
+        self, city_data_prettytable: PrettyTable
+    ) -> None:
+        rows = [row[:] for row in city_data_prettytable.rows]
+        city_data_prettytable.get_string(sortby="Area", end=3, hrules=ALL)
+        city_data_prettytable.get_html_string(sortby="Population")
+        assert city_data_prettytable.rows == rows
+
     def test_sort_slice(self) -> None:
         """Make sure sorting and slicing interact in the expected way"""
         table = PrettyTable(["Foo"])
@@ -809,6 +979,263 @@ class TestSorting:
         assert "10" not in oldstyle
         assert "20" in oldstyle
 
+    @pytest.mark.parametrize("reversesort", [False, True])
+    @pytest.mark.parametrize("end", [3, 20])
+    def test_sort_by_several_fields(self, reversesort: bool, end: int) -> None:
+        rows = [[f"region {i % 3}", i % 4, f"row {i}"] for i in range(20)]
+        table = PrettyTable(["Region", "Latency", "Name"])
+        table.add_rows(rows)
+        # Sorted by region, then by descending latency, ties kept in table order
+        expected_rows = sorted(rows, key=lambda row: row[1], reverse=not reversesort)
+        expected_rows.sort(key=lambda row: row[0], reverse=reversesort)
+        expected = PrettyTable(["Region", "Latency", "Name"])
+        expected.add_rows(expected_rows[:end])
+        assert (
+            table.get_string(
+                sortby=["Region", ("Latency", True)], reversesort=reversesort, end=end
+            )
+            == expected.get_string()
+        )
+
+    def test_sort_by_several_fields_key(self) -> None:
+        # sort_key is applied to the value of each field
+        table = PrettyTable(["Name", "Size"])
+        table.add_rows([["bb", 1], ["a", 2], ["ccc", 1]])
+        table.sortby = ["Size", "Name"]
+        table.sort_key = str
+        assert table.rows == [["bb", 1], ["a", 2], ["ccc", 1]]
+        assert table.get_csv_string().splitlines()[1:] == ["bb,1", "ccc,1", "a,2"]
+        table.sortby = [("Size", False), ("Name", True)]
+        assert table.get_csv_string().splitlines()[1:] == ["ccc,1", "bb,1", "a,2"]
+        table.sortby = [("Name", True)]
+        table.sort_key = len
+        assert table.get_csv_string().splitlines()[1:] == ["ccc,1", "bb,1", "a,2"]
+
+    @pytest.mark.parametrize(
+        "sortby", [["Name", "Nope"], [("Name", True, False)], [["Name", True]]]
+    )
+    def test_sort_by_several_fields_invalid(self, sortby: Any) -> None:
+        table = PrettyTable(["Name", "Size"])
+        with pytest.raises(ValueError):
+            table.sortby = sortby
+
+    def test_sort_keys_kept(self) -> None:
+        calls = []
+
+        def key(vals: list[Any]) -> Any:
+            calls.append(vals[0])
+            return vals[0]
+
+        table = PrettyTable(["Value"], sortby="Value", sort_key=key)
+        table.add_rows([[3], [1], [2]])
+        assert table.get_string() == table.get_string()
+        assert len(calls) == 3
+        table.add_row([0])
+        table.get_string(end=2)
+        assert len(calls) == 4
+        table.del_row(0)
+        table.get_string(reversesort=True)
+        assert len(calls) == 4
+        table.sort_key = lambda vals: key(vals)
+        table.get_string()
+        assert len(calls) == 7
+
+    def test_sort_keys_share_rows(self) -> None:
+        table = PrettyTable(["Name", "Value"])
+        table.add_rows([["b", 2], ["a", 2], ["c", 1]])
+        assert table.get_csv_string(sortby="Value").splitlines()[1:] == [
+            "c,1",
+            "a,2",
+            "b,2",
+        ]
+        # The kept keys refer to the rows rather than holding copies of them
+        assert table._sort_keys[0][1] is table._rows[0]
+
+    @pytest.mark.parametrize("reversesort", [False, True])
+    @pytest.mark.parametrize("start, end", [(0, 20), (2, 5), (0, 0), (4, 40)])
+    @pytest.mark.parametrize("max_rows", [None, 12])
+    def test_sort_index(
+        self, reversesort: bool, start: int, end: int, max_rows: int | None
+    ) -> None:
+        # The indexed table prints the same as one sorted from scratch, as rows
+        # are added and deleted, including the order of ties
+        indexed = PrettyTable(["Group", "Name"], sort_index=True, max_rows=max_rows)
+        plain = PrettyTable(["Group", "Name"], max_rows=max_rows)
+        options = {
+            "sortby": "Group",
+            "reversesort": reversesort,
+            "start": start,
+            "end": end,
+        }
+        for i in range(10):
+            indexed.add_row([i % 4, f"row {i}"])
+            plain.add_row([i % 4, f"row {i}"])
+            assert indexed.get_string(**options) == plain.get_string(**options)
+        for rows in ([[2, "more"]], [[i % 3, f"batch {i}"] for i in range(6)]):
+            indexed.add_rows(rows)
+            plain.add_rows(rows)
+            assert indexed.get_string(**options) == plain.get_string(**options)
+        for index in (0, 3, -1):
+            indexed.del_row(index)
+            plain.del_row(index)
+            assert indexed.get_string(**options) == plain.get_string(**options)
+        assert indexed.get_string(sortby="Name") == plain.get_string(sortby="Name")
+        indexed.add_column("Size", [len(row[1]) for row in indexed.rows])
+        plain.add_column("Size", [len(row[1]) for row in plain.rows])
+        assert indexed.get_string(**options) == plain.get_string(**options)
+
+    @pytest.mark.parametrize("sort_index", [False, True])
+    def test_sort_column_types_change(self, sort_index: bool) -> None:
+        table = PrettyTable(["x"], column_types={"x": int}, sort_index=sort_index)
+        table.add_rows([[3], [1]])
+        table.get_string(sortby="x")
+        table.column_types = {}
+        table.add_row([2])
+        assert table.get_csv_string(sortby="x").splitlines()[1:] == ["1", "2", "3"]
+
+    def test_sort_index_invalid(self) -> None:
+        with pytest.raises(ValueError, match="Invalid value for sort_index"):
+            PrettyTable(["Value"], sort_index="no")
+        with pytest.raises(ValueError, match="Invalid value for sort_index"):
+            PrettyTable(["Value"]).sort_index = "yes"  # type: ignore[assignment]
+
+    def test_sort_index_kept(self) -> None:
+        calls = []
+
+        def key(vals: list[Any]) -> Any:
+            calls.append(vals[0])
+            return vals[0]
+
+        table = PrettyTable(["Value"], sort_index=True, sortby="Value", sort_key=key)
+        table.add_rows([[3], [1], [2]])
+        assert table.get_string() == table.get_string()
+        assert len(calls) == 3
+        table.add_row([0])
+        assert len(calls) == 4
+        assert "|   0   |" in table.get_string(end=1)
+        assert len(calls) == 4
+        table.sort_index = False
+        table.get_string()
+        # Sorting without the index reuses the keys worked out to build it
+        assert len(calls) == 5
+
+    def test_sort_index_incomparable(self) -> None:
+        table = PrettyTable(["Value"], sort_index=True, sortby="Value")
+        table.add_rows([[2], [1]])
+        table.get_string()
+        # Adding the row works as it does without the index, and printing the
+        # table sorted fails the same way
+        table.add_row([None])
+        with pytest.raises(TypeError):
+            table.get_string()
+        table.del_row(2)
+        assert table.get_csv_string().splitlines()[1:] == ["1", "2"]
+
+    def test_sort_index_kept_on_delete(self) -> None:
+        table = PrettyTable(["Value"], sort_index=True, sortby="Value", max_rows=50)
+        plain = PrettyTable(["Value"], sortby="Value", max_rows=50)
+        for table_ in (table, plain):
+            table_.add_rows([[i * 7 % 50] for i in range(50)])
+        table.get_string()
+        index_keys = table._index_keys
+        for i in range(30):
+            # Each new row evicts the oldest one
+            table.add_row([i % 5])
+            plain.add_row([i % 5])
+            if i % 10 == 5:
+                table.del_row(3)
+                plain.del_row(3)
+            assert table.get_string() == plain.get_string()
+            assert table.get_string(reversesort=True) == plain.get_string(
+                reversesort=True
+            )
+        # The entries were added and removed in place, not sorted again
+        assert table._index_keys is index_keys
+
+
+class TestRowFilter:
+    ROWS = [[f"region {i % 3}", i % 4, f"row {i}"] for i in range(20)]
+
+    def expected(self, keep: Callable[[list[Any]], bool]) -> PrettyTable:
+        table = PrettyTable(["Region", "Latency", "Name"])
+        table.add_rows([row for row in self.ROWS if keep(row)])
+        return table
+
+    @pytest.mark.parametrize("filter_index", [[], ["Region"], ["Region", "Latency"]])
+    def test_filter_values(self, filter_index: list[str]) -> None:
+        table = PrettyTable(["Region", "Latency", "Name"], filter_index=filter_index)
+        table.add_rows(self.ROWS)
+        row_filter = {"Region": "region 1", "Latency": 3}
+        expected = self.expected(lambda row: row[0] == "region 1" and row[1] == 3)
+        assert table.get_string(row_filter=row_filter) == expected.get_string()
+        assert table.get_csv_string(row_filter=row_filter) == expected.get_csv_string()
+        assert (
+            table.get_json_string(row_filter=row_filter) == expected.get_json_string()
+        )
+        table.row_filter = {"Region": "region 9"}
+        expected = self.expected(lambda row: False)
+        assert table.get_html_string() == expected.get_html_string()
+
+    def test_filter_function(self) -> None:
+        table = PrettyTable(
+            ["Region", "Latency", "Name"], row_filter=lambda row: row[1]
+        )
+        table.add_rows(self.ROWS)
+        expected = self.expected(lambda row: row[1])
+        assert table.get_string() == expected.get_string()
+        assert table.get_string(sortby="Latency", reversesort=True, start=1, end=6) == (
+            expected.get_string(sortby="Latency", reversesort=True, start=1, end=6)
+        )
+        assert table.get_latex_string() == expected.get_latex_string()
+
+    def test_filter_index_kept(self) -> None:
+        # Rows added, deleted and evicted since the last lookup are indexed
+        table = PrettyTable(["Region", "Latency", "Name"], filter_index=["Region"])
+        table.max_rows = 12
+        plain = PrettyTable(["Region", "Latency", "Name"], max_rows=12)
+        row_filter = {"Region": "region 2"}
+        for row in self.ROWS:
+            table.add_row(row)
+            plain.add_row(row)
+            assert table.get_string(row_filter=row_filter) == plain.get_string(
+                row_filter=row_filter
+            )
+        table.del_row(3)
+        plain.del_row(3)
+        table.field_names = ["Area", "Latency", "Name"]
+        plain.field_names = ["Area", "Latency", "Name"]
+        assert table.filter_index == ["Area"]
+        assert table.get_string(row_filter={"Area": "region 0"}) == plain.get_string(
+            row_filter={"Area": "region 0"}
+        )
+
+    def test_filter_dividers(self) -> None:
+        table = PrettyTable(["Value"])
+        for value in range(6):
+            table.add_row([value], divider=value in (1, 2))
+        expected = PrettyTable(["Value"])
+        expected.add_row([0])
+        expected.add_row([2], divider=True)
+        expected.add_row([4])
+        assert (
+            table.get_string(row_filter=lambda row: row[0] % 2 == 0)
+            == expected.get_string()
+        )
+
+    @pytest.mark.parametrize("filter_index", ["Region", 1])
+    def test_filter_index_invalid(self, filter_index: Any) -> None:
+        with pytest.raises(ValueError, match="Invalid value for filter_index"):
+            PrettyTable(["Region"], filter_index=filter_index)
+        table = PrettyTable(["Region"])
+        with pytest.raises(ValueError, match="Invalid value for filter_index"):
+            table.filter_index = filter_index
+
+    @pytest.mark.parametrize("row_filter", [{"Nope": 1}, "Region"])
+    def test_filter_invalid(self, row_filter: Any) -> None:
+        table = PrettyTable(["Region", "Latency", "Name"])
+        with pytest.raises(ValueError):
+            table.row_filter = row_filter
+
 
 @pytest.fixture(scope="function")
 def float_pt() -> PrettyTable:
@@ -980,6 +1407,57 @@ class TestAnsiWidth:
         )
 
 
+class TestWidthCache:
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        prettytable.set_width_cache_size()
+        yield
+        prettytable.set_width_cache_size()
+
+    def test_repeated_values_hit_cache(self) -> None:
+        table = PrettyTable(["Status"])
+        for _ in range(10):
+            table.add_row(["\033[31mfailed\033[0m"])
+        table.get_string()
+        info = prettytable.width_cache_info()
+        assert info.maxsize == prettytable.prettytable.WIDTH_CACHE_SIZE
+        assert info.hits > info.misses
+
+    def test_set_size(self) -> None:
+        prettytable.set_width_cache_size(2)
+        table = PrettyTable(["A", "B", "C"])
+        table.add_row(["é", "日本", "\033[1mzzz\033[0m"])
+        table.get_string()
+        info = prettytable.width_cache_info()
+        assert info.maxsize == 2
+        assert info.currsize == 2
+
+    def test_ascii_bypasses_cache(self) -> None:
+        table = PrettyTable(["A", "B"])
+        table.add_row(["plain", "text"])
+        table.get_string()
+        assert prettytable.width_cache_info().currsize == 0
+
+    @pytest.mark.parametrize(
+        "text, width",
+        [
+            ("abc", 3),
+            ("", 0),
+            ("a\tb", -1),
+            ("\033[31mred\033[0m", 3),
+            ("日本語", 6),
+        ],
+    )
+    def test_str_block_width(self, text: str, width: int) -> None:
+        assert prettytable.prettytable._str_block_width(text) == width
+
+    def test_disabled(self, city_data_prettytable: PrettyTable) -> None:
+        expected = city_data_prettytable.get_string()
+        prettytable.set_width_cache_size(0)
+        assert city_data_prettytable.get_string() == expected
+        assert prettytable.width_cache_info().currsize == 0
+
+
 class TestFromDB:
     @pytest.mark.usefixtures("init_db")
     def test_non_select_cursor(self, db_cursor) -> None:
@@ -1874,6 +2352,148 @@ class TestJSONConstructor:
         assert new_table.get_string() == city_data_prettytable.get_string()
 
 
+class TestNumpyConstructor:
+    @pytest.fixture
+    def np(self) -> Any:
+        return pytest.importorskip("numpy")
+
+    @staticmethod
+    def list_table(field_names: list[str], rows: list[list[Any]]) -> PrettyTable:
+        table = PrettyTable(field_names)
+        table.add_rows(rows)
+        return table
+
+    def test_2d_array(self, np: Any) -> None:
+        data = np.array([[1295, 600.5], [5905, 1146.4], [112, 1714.7]])
+        table = from_numpy(data, ["Area", "Rainfall"])
+        assert np.shares_memory(table._rows.columns[0], data)
+        expected = self.list_table(["Area", "Rainfall"], data.tolist())
+        for t in table, expected:
+            t.float_format["Area"] = ".0"
+            t.float_format["Rainfall"] = "8.2"
+        assert table.get_string(sortby="Rainfall", reversesort=True) == (
+            expected.get_string(sortby="Rainfall", reversesort=True)
+        )
+        assert table.get_json_string() == expected.get_json_string()
+
+    def test_structured_array(self, np: Any) -> None:
+        data = np.array(
+            [("Adelaide", 1158259, 600.5), ("Darwin", 120900, 1714.7)],
+            dtype=[("City", "U10"), ("Population", "i8"), ("Rainfall", "f4")],
+        )
+        table = from_numpy(data, int_format="09")
+        expected = self.list_table(
+            ["City", "Population", "Rainfall"], [list(row) for row in data.tolist()]
+        )
+        expected.int_format = "09"
+        assert table.field_names == ["City", "Population", "Rainfall"]
+        assert "001158259" in table.get_string()
+        assert table.get_string() == expected.get_string()
+
+    def test_columns(self, np: Any) -> None:
+        table = from_numpy([np.arange(3), ["a", "b", "c"]])
+        assert table.field_names == ["Field 1", "Field 2"]
+        assert table.rows == [[0, "a"], [1, "b"], [2, "c"]]
+        assert all(type(row[0]) is int for row in table.rows)
+
+    @pytest.mark.parametrize("sort_index", [False, True])
+    def test_object_array(self, np: Any, sort_index: bool) -> None:
+        # Mixed types, as from DataFrame.to_numpy()
+        data = np.array([["b", 2], ["a", 1], ["c", 3]], dtype=object)
+        table = from_numpy(data, ["x", "y"], sort_index=sort_index, filter_index=["x"])
+        expected = self.list_table(["x", "y"], data.tolist())
+        assert table.rows[0] == ["b", 2]
+        assert table[0].get_string() == expected[0].get_string()
+        assert table.get_string(sortby="y") == expected.get_string(sortby="y")
+        table.add_row(["d", 0])
+        expected.add_row(["d", 0])
+        assert table.get_string(sortby="y", row_filter={"x": "d"}) == (
+            expected.get_string(sortby="y", row_filter={"x": "d"})
+        )
+
+    def test_modify(self, np: Any) -> None:
+        table = from_numpy(np.arange(6).reshape(3, 2), ["A", "B"])
+        table.add_column("C", np.array([0.5, 1.5, 2.5]))
+        table.add_row([6, 7, 3.5])
+        table.del_row(0)
+        table.del_column("A")
+        assert table.rows == [[3, 1.5], [5, 2.5], [7, 3.5]]
+
+    def test_different_lengths(self, np: Any) -> None:
+        with pytest.raises(ValueError, match="same length"):
+            from_numpy([np.arange(3), np.arange(4)])
+
+
+class TestSequenceConstructor:
+    class Source:
+        """A read-only row source which records the rows asked for"""
+
+        def __init__(self, length: int) -> None:
+            self.length = length
+            self.fetched: list[int] = []
+
+        def __len__(self) -> int:
+            return self.length
+
+        def __getitem__(self, index: int) -> tuple[int, str]:
+            if not 0 <= index < self.length:
+                raise IndexError(index)
+            self.fetched.append(index)
+            return index, f"row {index}"
+
+    def test_only_printed_rows_fetched(self) -> None:
+        source = self.Source(10**8)
+        table = from_sequence(source, ["Id", "Name"])
+        assert table.rowcount == 10**8
+        result = table.get_string(start=5000, end=5003)
+        assert sorted(source.fetched) == [5000, 5001, 5002]
+        assert (
+            result
+            == from_sequence(
+                [(i, f"row {i}") for i in range(5000, 5003)], ["Id", "Name"]
+            ).get_string()
+        )
+
+    def test_same_output(self, city_data_prettytable: PrettyTable) -> None:
+        table = from_sequence(
+            [tuple(row) for row in city_data_prettytable.rows],
+            city_data_prettytable.field_names,
+        )
+        for kwargs in ({}, {"sortby": "Area"}, {"start": 2, "end": 4}):
+            assert table.get_string(**kwargs) == city_data_prettytable.get_string(
+                **kwargs
+            )
+            assert table.get_csv_string(**kwargs) == (
+                city_data_prettytable.get_csv_string(**kwargs)
+            )
+        assert table.rows == city_data_prettytable.rows
+        assert table.dividers == [False] * 7
+        assert table[-2:].get_string() == city_data_prettytable[-2:].get_string()
+
+    def test_rows_changed_between_renders(self) -> None:
+        rows = [("a", 1), ("b", 2)]
+        table = from_sequence(rows, ["Name", "Value"])
+        table.get_string()
+        rows[0] = ("a much longer name", 1)
+        assert "| a much longer name |" in table.get_string()
+
+    def test_modify(self) -> None:
+        source = self.Source(3)
+        table = from_sequence(source)
+        assert table.field_names == ["Field 1", "Field 2"]
+        table.add_row([3, "row 3"], divider=True)
+        table.del_row(0)
+        assert table.rows == [[1, "row 1"], [2, "row 2"], [3, "row 3"]]
+        assert table.dividers == [False, False, True]
+        source.length = 0
+        assert table.rowcount == 3
+
+    def test_wrong_row_length(self) -> None:
+        table = from_sequence([(1, 2), (3,)], ["A", "B"])
+        with pytest.raises(ValueError, match=r"\(actual\) 1!=2 \(expected\)"):
+            table.get_string()
+
+
 class TestHtmlConstructor:
     def test_html_and_back(self, city_data_prettytable: PrettyTable) -> None:
         html_string = city_data_prettytable.get_html_string()
@@ -2036,6 +2656,86 @@ def test_paginate() -> None:
     assert "\n" in paginated
 
 
+class TestIterLines:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"title": "Cities"},
+            {"title": "Cities", "header": False},
+            {"hrules": ALL},
+            {"border": False},
+            {"sortby": "Area", "start": 1, "end": 4},
+        ],
+    )
+    def test_matches_get_string(
+        self, city_data_prettytable: PrettyTable, kwargs: dict[str, Any]
+    ) -> None:
+        lines = city_data_prettytable.iter_lines(**kwargs)
+        assert "\n".join(lines) == city_data_prettytable.get_string(**kwargs)
+
+    def test_yields_single_lines(self, city_data_prettytable: PrettyTable) -> None:
+        city_data_prettytable.title = "Cities"
+        lines = list(city_data_prettytable.iter_lines(hrules=ALL))
+        # title (2) + header (3) + each row followed by an hrule (7 * 2)
+        assert len(lines) == 2 + 3 + 7 * 2
+        assert all("\n" not in line for line in lines)
+
+    def test_orgmode(self, city_data_prettytable: PrettyTable) -> None:
+        city_data_prettytable.set_style(ORGMODE)
+        lines = list(city_data_prettytable.iter_lines())
+        assert "\n".join(lines) == city_data_prettytable.get_string()
+        assert all(line.startswith("|") for line in lines)
+
+    def test_empty(self) -> None:
+        assert list(PrettyTable(["A", "B"]).iter_lines(print_empty=False)) == []
+
+
+class TestDump:
+    @pytest.mark.parametrize("out_format", ["text", "html", "json", "csv", "latex"])
+    def test_matches_get_formatted_string(
+        self, city_data_prettytable: PrettyTable, out_format: str
+    ) -> None:
+        fp = io.StringIO()
+        city_data_prettytable.dump(fp, out_format, sortby="Area", end=4)
+        assert fp.getvalue() == city_data_prettytable.get_formatted_string(
+            out_format, sortby="Area", end=4
+        )
+
+    @pytest.mark.parametrize("out_format", ["html", "latex"])
+    def test_formatted(
+        self, city_data_prettytable: PrettyTable, out_format: str
+    ) -> None:
+        fp = io.StringIO()
+        city_data_prettytable.dump(fp, out_format, format=True)
+        assert fp.getvalue() == city_data_prettytable.get_formatted_string(
+            out_format, format=True
+        )
+
+    def test_binary(self, city_data_prettytable: PrettyTable) -> None:
+        city_data_prettytable.add_row(["Zürich", 88, 402762, 1134.0])
+        fp = io.BytesIO()
+        city_data_prettytable.dump(fp)
+        assert fp.getvalue() == city_data_prettytable.get_string().encode()
+        assert not fp.closed
+
+    def test_csv_options(self, city_data_prettytable: PrettyTable) -> None:
+        fp = io.StringIO()
+        city_data_prettytable.dump(fp, "csv", header=False, delimiter="\t")
+        assert fp.getvalue() == city_data_prettytable.get_csv_string(
+            header=False, delimiter="\t"
+        )
+
+    def test_invalid_format(self, city_data_prettytable: PrettyTable) -> None:
+        with pytest.raises(ValueError, match="Invalid format"):
+            city_data_prettytable.dump(io.StringIO(), "yaml")
+
+    def test_empty(self) -> None:
+        fp = io.StringIO()
+        PrettyTable(["A", "B"]).dump(fp, print_empty=False)
+        assert fp.getvalue() == ""
+
+
 def test_add_rows() -> None:
     """A table created with multiple add_row calls
     is the same as one created with a single add_rows
@@ -2057,6 +2757,31 @@ def test_add_rows() -> None:
     assert str(table1) == str(table2)
 
 
+def test_add_rows_copy() -> None:
+    rows = [[1, 2], (3, 4)]
+    table = PrettyTable(["A", "B"])
+    table.add_rows(rows)
+    table.add_rows(iter(rows), copy=False)
+    assert table._rows[0] is not rows[0]
+    assert table._rows[2] is rows[0]
+    assert table._rows[3] == [3, 4]
+    assert table.rows == [[1, 2], [3, 4], [1, 2], [3, 4]]
+
+
+def test_add_rows_field_names() -> None:
+    table = PrettyTable()
+    table.add_rows([(1, 2), (3, 4)])
+    assert table.field_names == ["Field 1", "Field 2"]
+    assert table.dividers == [False, False]
+
+
+def test_add_rows_wrong_length() -> None:
+    table = PrettyTable(["A", "B"])
+    with pytest.raises(ValueError, match=r"\(actual\) 3!=2 \(expected\)"):
+        table.add_rows([[1, 2], [3, 4, 5]])
+    assert table.rowcount == 0
+
+
 def test_autoindex() -> None:
     """Testing that a table with a custom index row is
     equal to the one produced by the function
@@ -2457,6 +3182,757 @@ class TestRowEndSection:
 """.strip()
         )
 
+    def test_row_end_section_with_start(self) -> None:
+        table = PrettyTable(["Field 1"])
+        table.add_row(["value 1"], divider=True)
+        table.add_row(["value 2"])
+        table.add_row(["value 3"], divider=True)
+        table.add_row(["value 4"])
+        assert (
+            table.get_string(start=1).strip()
+            == """
++---------+
+| Field 1 |
++---------+
+| value 2 |
+| value 3 |
++---------+
+| value 4 |
++---------+
+""".strip()
+        )
+
+    @pytest.mark.parametrize("row_index", [0, 1, 2, -1, -4])
+    def test_del_row_moves_dividers(self, row_index: int) -> None:
+        table = PrettyTable(["Field 1"])
+        for v in range(5):
+            table.add_row([f"value {v}"], divider=v in (1, 3))
+        expected = table.dividers
+        del expected[row_index]
+        table.del_row(row_index)
+        assert table.dividers == expected
+
+        rebuilt = PrettyTable(["Field 1"])
+        for row, divider in zip(table.rows, expected):
+            rebuilt.add_row(row, divider=divider)
+        assert table.get_string() == rebuilt.get_string()
+        assert table.get_string(start=1, end=3) == rebuilt.get_string(start=1, end=3)
+
+
+class TestIncrementalWidths:
+    """Widths kept between renders must always match a freshly built table"""
+
+    @staticmethod
+    def rebuilt(table: PrettyTable) -> str:
+        fresh = PrettyTable(table.field_names)
+        fresh.add_rows(table.rows)
+        fresh.float_format.update(table.float_format)
+        fresh.none_format.update(table.none_format)
+        return fresh.get_string()
+
+    def test_add_row(self, city_data_prettytable: PrettyTable) -> None:
+        city_data_prettytable.get_string()
+        city_data_prettytable.add_row(["Alice Springs", 1, 23, 287.5])
+        assert city_data_prettytable.get_string() == self.rebuilt(city_data_prettytable)
+
+    @pytest.mark.parametrize("row_index", [0, 3, -1, -7])
+    def test_del_row(self, city_data_prettytable: PrettyTable, row_index: int) -> None:
+        city_data_prettytable.add_row(["Alice Springs", 1, 23, 287.5])
+        city_data_prettytable.get_string(sortby="Area")
+        city_data_prettytable.del_row(row_index)
+        city_data_prettytable.del_row(-1)
+        assert city_data_prettytable.get_string() == self.rebuilt(city_data_prettytable)
+
+    def test_del_unmeasured_row(self, city_data_prettytable: PrettyTable) -> None:
+        city_data_prettytable.get_string()
+        city_data_prettytable.add_row(["Alice Springs", 1, 23, 287.5])
+        city_data_prettytable.add_row(["Katherine", 2, 34, 1096.7])
+        city_data_prettytable.del_row(-2)
+        assert city_data_prettytable.get_string() == self.rebuilt(city_data_prettytable)
+
+    def test_format_change(self, city_data_prettytable: PrettyTable) -> None:
+        city_data_prettytable.get_string()
+        city_data_prettytable.float_format["Annual Rainfall"] = "10.4"
+        city_data_prettytable.none_format = "missing"
+        assert city_data_prettytable.get_string() == self.rebuilt(city_data_prettytable)
+
+    def test_replace_column(self, city_data_prettytable: PrettyTable) -> None:
+        city_data_prettytable.get_string()
+        city_data_prettytable.del_column("Area")
+        city_data_prettytable.add_column("Area", ["a very long area value"] * 7)
+        assert city_data_prettytable.get_string() == self.rebuilt(city_data_prettytable)
+
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_batch_columns(
+        self, city_data_prettytable: PrettyTable, columnar: bool
+    ) -> None:
+        city_data_prettytable.columnar = columnar
+        city_data_prettytable.none_format["Area"] = "missing"
+        city_data_prettytable.get_string()
+        city_data_prettytable.del_columns(["Area", "City name"])
+        assert city_data_prettytable.get_string() == self.rebuilt(city_data_prettytable)
+        city_data_prettytable.add_columns(
+            {"Area": [None] * 7, "City name": ["a very long city name"] * 7}
+        )
+        assert city_data_prettytable.get_string() == self.rebuilt(city_data_prettytable)
+
+    def test_add_column_after_partial_renders(self) -> None:
+        # Rows measured before the format changed back have no formatted values
+        # kept, but still need the new column measured
+        table = PrettyTable(["a"])
+        table.add_rows([[1], [2], [3]])
+        table.get_string()
+        table.int_format["a"] = "5"
+        table.get_string(end=1)
+        del table.int_format["a"]
+        table.get_string(end=1)
+        table.add_column("b", ["x", "y", "a_very_long_value"])
+        assert table.get_string() == self.rebuilt(table)
+        table.del_column("a")
+        assert table.get_string() == self.rebuilt(table)
+
+    def test_clear_rows(self, city_data_prettytable: PrettyTable) -> None:
+        city_data_prettytable.get_string()
+        city_data_prettytable.clear_rows()
+        city_data_prettytable.add_row(["X", 1, 2, 3.0])
+        assert city_data_prettytable.get_string() == self.rebuilt(city_data_prettytable)
+
+    def test_partial_render(self, city_data_prettytable: PrettyTable) -> None:
+        city_data_prettytable.get_string()
+        assert "Melbourne" not in city_data_prettytable.get_string(end=2)
+        assert city_data_prettytable.get_string(end=2).splitlines()[0] == (
+            "+-----------+------+------------+-----------------+"
+        )
+
+
+class TestFormatCache:
+    @pytest.fixture
+    def counted_table(self) -> tuple[PrettyTable, list[Any]]:
+        calls: list[Any] = []
+
+        def fmt(field: str, value: Any) -> str:
+            calls.append(value)
+            return f"<{value}>"
+
+        table = PrettyTable(["A", "B"])
+        table.add_rows([[1, 2.5], [3, 4.5], [5, 6.5]])
+        table.custom_format["A"] = fmt
+        return table, calls
+
+    def test_formats_once(self, counted_table) -> None:
+        table, calls = counted_table
+        first = table.get_string()
+        assert table.get_string() == first
+        assert table.get_html_string()
+        assert calls == [1, 3, 5]
+
+    def test_add_row(self, counted_table) -> None:
+        table, calls = counted_table
+        table.get_string()
+        table.add_row([7, 8.5])
+        assert "<7>" in table.get_string()
+        assert calls == [1, 3, 5, 7]
+
+    def test_del_row(self, counted_table) -> None:
+        table, calls = counted_table
+        table.get_string()
+        table.del_row(1)
+        result = table.get_string()
+        assert "<3>" not in result
+        assert "<5>" in result
+        assert calls == [1, 3, 5]
+
+    def test_partial_render(self, counted_table) -> None:
+        table, calls = counted_table
+        table.get_string(start=2)
+        assert calls == [5]
+        table.get_string(sortby="A", reversesort=True)
+        assert calls == [5, 3, 1]
+
+    def test_format_change(self, counted_table) -> None:
+        table, calls = counted_table
+        table.get_string()
+        table.float_format["B"] = ".3"
+        assert "2.500" in table.get_string()
+        assert calls == [1, 3, 5, 1, 3, 5]
+
+    def test_column_change(self, counted_table) -> None:
+        table, calls = counted_table
+        table.get_string()
+        table.del_column("A")
+        table.add_column("A", [10, 30, 50])
+        assert "<10>" in table.get_string()
+        assert calls == [1, 3, 5, 10, 30, 50]
+
+    def test_batch_columns(self, counted_table) -> None:
+        table, calls = counted_table
+        table.get_string()
+        table.add_columns({"C": ["x", "y", "z"], "D": [0, 0, 0]})
+        table.del_columns(["B", "D"])
+        result = table.get_string()
+        assert "<3>" in result
+        assert "2.5" not in result
+        assert calls == [1, 3, 5]
+        assert table._format_key == table._get_format_key()
+
+
+class TestFormatExecutor:
+    class RecordingExecutor(ThreadPoolExecutor):
+        def __init__(self) -> None:
+            super().__init__(max_workers=4)
+            self.chunks: list[int] = []
+
+        def map(self, fn, *iterables, **kwargs):  # type: ignore[override]
+            (chunks,) = iterables
+            chunks = list(chunks)
+            self.chunks.extend(len(chunk) for chunk in chunks)
+            return super().map(fn, chunks, **kwargs)
+
+    chunk_size = prettytable.prettytable.FORMAT_CHUNK_SIZE
+
+    @staticmethod
+    def big_table(rows: int) -> PrettyTable:
+        table = PrettyTable(["Id", "Price", "Label"])
+        table.add_rows([[i, i / 7, f"item {i}"] for i in range(rows)])
+        table.float_format["Price"] = ".2"
+        table.custom_format["Label"] = lambda f, v: v.upper()
+        return table
+
+    def test_matches_serial(self) -> None:
+        rows = self.chunk_size * 3 + 5
+        expected = self.big_table(rows)
+        with self.RecordingExecutor() as executor:
+            table = self.big_table(rows)
+            table.format_executor = executor
+            assert table.get_string() == expected.get_string()
+            assert table.get_html_string() == expected.get_html_string()
+        assert executor.chunks == [self.chunk_size] * 3 + [5]
+
+    def test_keyword_argument(self) -> None:
+        rows = self.chunk_size * 2
+        expected = self.big_table(rows).get_string(sortby="Id", reversesort=True)
+        with self.RecordingExecutor() as executor:
+            table = self.big_table(rows)
+            result = table.get_string(
+                sortby="Id", reversesort=True, format_executor=executor
+            )
+        assert result == expected
+        assert executor.chunks == [self.chunk_size] * 2
+
+    def test_small_table_serial(self) -> None:
+        with self.RecordingExecutor() as executor:
+            table = self.big_table(self.chunk_size)
+            table.format_executor = executor
+            table.get_string()
+        assert executor.chunks == []
+
+    def test_cached_rows_not_resubmitted(self) -> None:
+        with self.RecordingExecutor() as executor:
+            table = self.big_table(self.chunk_size * 2)
+            table.format_executor = executor
+            table.get_string()
+            table.add_row([-1, 0.0, "new"])
+            assert "NEW" in table.get_string()
+        assert executor.chunks == [self.chunk_size] * 2
+
+    def test_invalid_executor(self) -> None:
+        with pytest.raises(ValueError, match="Invalid value for format_executor"):
+            PrettyTable(format_executor=4)
+
+
+class TestColumnar:
+    @pytest.fixture
+    def columnar_table(self, city_data_prettytable: PrettyTable) -> PrettyTable:
+        table = PrettyTable(city_data_prettytable.field_names, columnar=True)
+        table.add_rows(city_data_prettytable.rows)
+        return table
+
+    def test_storage(self, columnar_table: PrettyTable) -> None:
+        assert columnar_table.columnar
+        assert columnar_table._rows.columns[0][:2] == ["Adelaide", "Brisbane"]
+        assert not PrettyTable().columnar
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"sortby": "Population", "reversesort": True},
+            {"start": 2, "end": 5, "fields": ["City name", "Area"]},
+        ],
+    )
+    def test_same_output(
+        self,
+        city_data_prettytable: PrettyTable,
+        columnar_table: PrettyTable,
+        kwargs: dict[str, Any],
+    ) -> None:
+        for table in city_data_prettytable, columnar_table:
+            table.float_format["Annual Rainfall"] = ".2"
+            table.custom_format["Area"] = lambda f, v: f"{v} km2"
+        for out_format in ("text", "html", "json", "csv", "latex"):
+            assert columnar_table.get_formatted_string(
+                out_format, **kwargs
+            ) == city_data_prettytable.get_formatted_string(out_format, **kwargs)
+
+    def test_row_api(
+        self, city_data_prettytable: PrettyTable, columnar_table: PrettyTable
+    ) -> None:
+        for table in city_data_prettytable, columnar_table:
+            table.del_row(-1)
+            table.add_row(["Canberra", 814, 381488, 616.4], divider=True)
+            table.del_row(0)
+        assert columnar_table.rows == city_data_prettytable.rows
+        assert columnar_table.rowcount == 6
+        assert columnar_table.get_string() == city_data_prettytable.get_string()
+        assert columnar_table[1:3].columnar
+        assert (
+            columnar_table[1:3].get_string() == city_data_prettytable[1:3].get_string()
+        )
+
+    def test_column_api(
+        self, city_data_prettytable: PrettyTable, columnar_table: PrettyTable
+    ) -> None:
+        for table in city_data_prettytable, columnar_table:
+            table.get_string()
+            table.del_column("Area")
+            table.add_column("Country", ["Australia"] * 7, align="l")
+            table.add_autoindex()
+        assert columnar_table.rows == city_data_prettytable.rows
+        assert columnar_table.get_string() == city_data_prettytable.get_string()
+
+    def test_add_columns_to_empty_table(self) -> None:
+        table = PrettyTable(columnar=True)
+        table.add_column("A", [1, 2])
+        table.add_column("B", ["x", "y"])
+        assert table.rows == [[1, "x"], [2, "y"]]
+
+    def test_switch(self, city_data_prettytable: PrettyTable) -> None:
+        expected = city_data_prettytable.get_string()
+        rows = city_data_prettytable.rows
+        city_data_prettytable.columnar = True
+        assert city_data_prettytable.get_string() == expected
+        city_data_prettytable.clear_rows()
+        assert city_data_prettytable.columnar
+        city_data_prettytable.add_rows(rows)
+        city_data_prettytable.columnar = False
+        assert isinstance(city_data_prettytable._rows, list)
+        assert city_data_prettytable.get_string() == expected
+
+    def test_invalid(self, city_data_prettytable: PrettyTable) -> None:
+        with pytest.raises(ValueError, match="Invalid value for columnar"):
+            city_data_prettytable.columnar = "yes"  # type: ignore[assignment]
+        with pytest.raises(ValueError, match="Invalid value for columnar"):
+            PrettyTable(columnar="no")
+
+
+class TestMaxRows:
+    @staticmethod
+    def tail(rows: list[list[Any]], **kwargs) -> PrettyTable:
+        table = PrettyTable(["Seq", "Event"], **kwargs)
+        table.add_rows(rows)
+        return table
+
+    def test_evicts_oldest(self) -> None:
+        table = PrettyTable(["Seq", "Event"], max_rows=3)
+        for i in range(5):
+            table.add_row([i, f"event {i}"], divider=i == 3)
+        assert table.rows == [[2, "event 2"], [3, "event 3"], [4, "event 4"]]
+        assert table.dividers == [False, True, False]
+        assert isinstance(table._rows, deque)
+
+    def test_same_output(self) -> None:
+        events = [[i, "x" * (10 - i)] for i in range(10)]
+        table = PrettyTable(["Seq", "Event"], max_rows=4)
+        for row in events:
+            table.add_row(row)
+            # Widths and formatted values kept between renders follow evictions
+            table.get_string()
+        expected = self.tail(events[-4:])
+        assert table.get_string() == expected.get_string()
+        for kwargs in ({"sortby": "Event"}, {"start": 1, "end": 3}):
+            for out_format in ("text", "html", "json", "csv", "latex"):
+                assert table.get_formatted_string(
+                    out_format, **kwargs
+                ) == expected.get_formatted_string(out_format, **kwargs)
+        assert table[1:3].get_string() == expected[1:3].get_string()
+
+    @pytest.mark.parametrize("categorical", [[], ["Event"]])
+    def test_evict_columnar(self, categorical: list[str]) -> None:
+        # Evicted rows are skipped over in the columns and caches before they are
+        # deleted from them, which must not show
+        events = [[i, f"event {i % 3}"] for i in range(30)]
+        table = PrettyTable(
+            ["Seq", "Event"], max_rows=4, columnar=True, categorical=categorical
+        )
+        for row in events:
+            table.add_row(row)
+            table.get_string(end=2)
+            table.get_string(sortby="Event")
+        expected = self.tail(events[-4:])
+        assert table.rows == expected.rows
+        assert table.get_string() == expected.get_string()
+        assert table.get_string(sortby="Event") == expected.get_string(sortby="Event")
+        table.add_column("Size", [1, 22, 333, 4444])
+        table.del_row(1)
+        expected.add_column("Size", [1, 22, 333, 4444])
+        expected.del_row(1)
+        assert table.get_string() == expected.get_string()
+
+    def test_add_rows(self) -> None:
+        table = PrettyTable(["Seq"], max_rows=3)
+        table.add_rows([[0], [1]])
+        table.add_rows([[2], [3]])
+        assert table.rows == [[1], [2], [3]]
+        table.add_rows([[i] for i in range(4, 10)])
+        assert table.rows == [[7], [8], [9]]
+
+    def test_set_max_rows(self) -> None:
+        table = self.tail([[i, i] for i in range(6)])
+        table.get_string()
+        table.max_rows = 2
+        assert table.rows == [[4, 4], [5, 5]]
+        assert table.get_string() == self.tail([[4, 4], [5, 5]]).get_string()
+        table.max_rows = None
+        table.add_rows([[6, 6], [7, 7]])
+        assert table.rowcount == 4
+        assert isinstance(table._rows, list)
+
+    def test_columnar(self) -> None:
+        table = PrettyTable(["Seq"], max_rows=2, columnar=True)
+        table.add_rows([[0], [1], [2]])
+        table.add_row([3])
+        assert table.rows == [[2], [3]]
+        table.columnar = False
+        assert isinstance(table._rows, deque)
+
+    def test_clear_rows(self) -> None:
+        table = PrettyTable(["Seq"], max_rows=2)
+        table.add_rows([[0], [1]])
+        table.clear_rows()
+        table.add_rows([[2], [3], [4]])
+        assert table.rows == [[3], [4]]
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="Invalid value for max_rows"):
+            PrettyTable(max_rows=-1)
+
+
+class TestColumnTypes:
+    CSV = """City name,Area,Population,Founded,Coastal
+Adelaide,1295,1158259,1836-12-28,yes
+Brisbane,5905,,1825-09-13,yes
+Darwin,112,120900,1869-02-05,yes
+Hobart,1357,205556,1804-02-20,yes
+Alice Springs,327,25186,,no
+"""
+
+    def test_convert_on_add(self) -> None:
+        table = PrettyTable(
+            ["Name", "Count", "Price", "Paid"],
+            column_types={"Count": int, "Price": Decimal, "Paid": bool},
+        )
+        table.add_row(["a", "3", 1.1, "true"])
+        table.add_rows([["b", 4.0, "2.50", 0], ["c", "", None, "no"]])
+        table.add_column("When", ["2024-01-02", None, "2024-01-02T10:30"])
+        assert table.rows == [
+            ["a", 3, Decimal("1.1"), True, "2024-01-02"],
+            ["b", 4, Decimal("2.50"), False, None],
+            ["c", None, None, False, "2024-01-02T10:30"],
+        ]
+
+    def test_from_csv(self) -> None:
+        table = from_csv(
+            io.StringIO(self.CSV),
+            column_types={"Area": int, "Population": int, "Founded": dt.date},
+        )
+        table.sortby = "Population"
+        assert table.rows[0] == [
+            "Adelaide",
+            1295,
+            1158259,
+            dt.date(1836, 12, 28),
+            "yes",
+        ]
+        # Sorted by number rather than as strings, with missing values last
+        populations = table.get_string(fields=["Population"], border=False)
+        assert populations.split()[1:] == [
+            "25186",
+            "120900",
+            "205556",
+            "1158259",
+            "None",
+        ]
+
+    def test_infer(self) -> None:
+        table = from_csv(io.StringIO(self.CSV))
+        assert table.infer_column_types() == {
+            "City name": str,
+            "Area": int,
+            "Population": int,
+            "Founded": dt.date,
+            "Coastal": bool,
+        }
+        assert table.column_types["Area"] is int
+        assert table.rows[4] == ["Alice Springs", 327, 25186, None, False]
+
+    def test_infer_keeps_declared_types(self) -> None:
+        table = PrettyTable(["A", "B", "C"], column_types={"A": str})
+        table.add_rows([["1", 2.5, 1], ["2", None, "x"]])
+        assert table.infer_column_types() == {"A": str, "B": float}
+
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_set_on_existing_rows(
+        self, city_data_prettytable: PrettyTable, columnar: bool
+    ) -> None:
+        city_data_prettytable.columnar = columnar
+        city_data_prettytable.add_row(["Canberra", "814", "381488", "616.4"])
+        city_data_prettytable.get_string()
+        city_data_prettytable.column_types = {"Population": int, "Area": float}
+        assert city_data_prettytable.rows[-1] == ["Canberra", 814.0, 381488, "616.4"]
+        assert "814.0" in city_data_prettytable.get_string()
+
+    @pytest.mark.parametrize("reversesort", [False, True])
+    @pytest.mark.parametrize("sort_index", [False, True])
+    @pytest.mark.parametrize(
+        "sortby", ["Count", ["Count"], [("Count", True)], ["Name", ("Count", True)]]
+    )
+    def test_sort_missing_last(
+        self, reversesort: bool, sort_index: bool, sortby: Any
+    ) -> None:
+        table = PrettyTable(
+            ["Name", "Count"], column_types={"Count": int}, sort_index=sort_index
+        )
+        table.add_rows([["a", 2], ["a", None], ["a", 1], ["a", 3]])
+        for _ in range(2):
+            lines = table.get_csv_string(
+                sortby=sortby, reversesort=reversesort
+            ).splitlines()
+            assert lines[-1] == "a,"
+            table.add_row(["a", 0])
+            table.del_row(-1)
+
+    @pytest.mark.parametrize("reversesort", [False, True])
+    @pytest.mark.parametrize("sort_index", [False, True])
+    def test_sort_ties_with_missing_values(
+        self, reversesort: bool, sort_index: bool
+    ) -> None:
+        table = PrettyTable(
+            ["a", "b"], column_types={"a": int, "b": int}, sort_index=sort_index
+        )
+        table.add_rows([[1, None], [1, 2], [0, 5]])
+        table.add_row([1, None])
+        lines = table.get_csv_string(sortby="a", reversesort=reversesort).splitlines()
+        # Rows with equal values are left in the order of the table
+        ties = ["1,", "1,2", "1,"]
+        assert lines[1:] == (ties + ["0,5"] if reversesort else ["0,5"] + ties)
+
+    def test_invalid_value(self, city_data_prettytable: PrettyTable) -> None:
+        city_data_prettytable.column_types = {"Area": int}
+        rows = city_data_prettytable.rows
+        with pytest.raises(ValueError, match="Can't convert 'big' to int"):
+            city_data_prettytable.add_rows(
+                [["Canberra", 814, 1, 1.0], ["Big", "big", 1, 1.0]]
+            )
+        with pytest.raises(ValueError, match="Can't convert 3.7 to int"):
+            city_data_prettytable.add_row(["Canberra", 3.7, 1, 1.0])
+        with pytest.raises(ValueError):
+            city_data_prettytable.add_row(["Canberra", Decimal("3.5"), 1, 1.0])
+        with pytest.raises(ValueError):
+            city_data_prettytable.column_types = {"City name": int}
+        assert city_data_prettytable.rows == rows
+        assert city_data_prettytable.column_types == {"Area": int}
+
+    def test_invalid_type(self) -> None:
+        with pytest.raises(ValueError, match="Invalid value for column_types"):
+            PrettyTable(["A"], column_types={"A": list})
+
+    @pytest.mark.parametrize(
+        "formats",
+        [
+            {"int_format": "04", "float_format": "6.2"},
+            {"custom_format": {"Area": lambda f, v: f"<{v}>"}},
+            {"int_format": "04", "custom_format": lambda f, v: f"<{v}>"},
+        ],
+    )
+    def test_same_output(
+        self, city_data_prettytable: PrettyTable, formats: dict[str, Any]
+    ) -> None:
+        city_data_prettytable.add_row(["Canberra", None, 381488, None])
+        typed = city_data_prettytable.copy()
+        typed.column_types = {
+            "City name": str,
+            "Area": int,
+            "Population": int,
+            "Annual Rainfall": float,
+        }
+        for table in city_data_prettytable, typed:
+            for name, value in formats.items():
+                setattr(table, name, value)
+        assert typed.get_string() == city_data_prettytable.get_string()
+
+    def test_rename_and_delete(self) -> None:
+        table = PrettyTable(["A", "B"], column_types={"A": int, "B": int})
+        table.field_names = ["C", "D"]
+        table.del_columns(["D"])
+        assert table.column_types == {"C": int}
+        table.add_row(["1"])
+        assert table.rows == [[1]]
+
+
+class TestCategorical:
+    @pytest.fixture
+    def hosts(self) -> list[list[Any]]:
+        return [
+            [f"host{i}", ["up", "down", "<unknown>"][i % 3], f"region {i % 2}"]
+            for i in range(10)
+        ]
+
+    def test_same_output(self, hosts: list[list[Any]]) -> None:
+        plain = PrettyTable(["Host", "Status", "Region"])
+        plain.add_rows(hosts)
+        table = PrettyTable(["Host", "Status", "Region"], categorical=["Status"])
+        table.add_rows(hosts)
+        assert table.columnar
+        column = table._rows.columns[1]
+        assert isinstance(column, prettytable.prettytable._CategoryColumn)
+        assert column.categories == ["up", "down", "<unknown>"]
+        assert table.rows == plain.rows
+        for kwargs in ({}, {"sortby": "Status"}, {"start": 2, "end": 5}):
+            for out_format in ("text", "html", "json", "csv"):
+                assert table.get_formatted_string(
+                    out_format, **kwargs
+                ) == plain.get_formatted_string(out_format, **kwargs)
+            assert table.get_html_string(
+                format=True, **kwargs
+            ) == plain.get_html_string(format=True, **kwargs)
+
+    def test_formats_each_value_once(self, hosts: list[list[Any]]) -> None:
+        calls: list[Any] = []
+
+        def fmt(field: str, value: Any) -> str:
+            calls.append(value)
+            return value.upper()
+
+        table = PrettyTable(["Host", "Status", "Region"], categorical=["Status"])
+        table.add_rows(hosts)
+        table.custom_format["Status"] = fmt
+        assert "<UNKNOWN>" in table.get_string()
+        assert calls == ["up", "down", "<unknown>"]
+
+    def test_changes(self, hosts: list[list[Any]]) -> None:
+        plain = PrettyTable(["Host", "Status", "Region"])
+        table = PrettyTable(["Host", "Status", "Region"])
+        table.categorical = ["Status", "Region"]
+        views = []
+        for t in plain, table:
+            t.add_rows(hosts)
+            t.add_row(["host10", "draining", "region 0"])
+            t.del_row(0)
+            t.add_columns({"Rack": ["r1"] * 10})
+            views.append(t[2:6])
+            t.del_columns(["Region"])
+        assert table.categorical == ["Status"]
+        assert table.rows == plain.rows
+        assert views[1].rows == views[0].rows
+        assert table.copy().get_string() == plain.get_string()
+
+    def test_equal_values_kept_apart(self) -> None:
+        table = PrettyTable(["Value"], categorical=["Value"])
+        table.add_rows([[1], [1.0], [True], [[1]], [[1]], [1]])
+        assert table.rows == [[1], [1.0], [True], [[1]], [[1]], [1]]
+        assert table.get_string().count("True") == 1
+        assert len(table._rows.columns[0].categories) == 5
+
+    def test_decode(self, hosts: list[list[Any]]) -> None:
+        table = PrettyTable(["Host", "Status", "Region"], categorical=["Status"])
+        table.add_rows(hosts)
+        table.field_names = ["Name", "State", "Region"]
+        assert table.categorical == ["State"]
+        table.categorical = []
+        assert isinstance(table._rows.columns[1], list)
+        table.categorical = ["Region"]
+        table.columnar = False
+        assert table.categorical == []
+        assert table.rows == hosts
+
+    @pytest.mark.parametrize("categorical", ["Status", 1])
+    def test_invalid(self, categorical: Any) -> None:
+        with pytest.raises(ValueError, match="Invalid value for categorical"):
+            PrettyTable(["Host", "Status"], categorical=categorical)
+        table = PrettyTable(["Host", "Status"])
+        with pytest.raises(ValueError, match="Invalid value for categorical"):
+            table.categorical = categorical
+
+
+class TestWidthEstimate:
+    @staticmethod
+    def long_table(long_row: int, **kwargs) -> PrettyTable:
+        table = PrettyTable(["Name"], **kwargs)
+        table.add_rows([["short"] for _ in range(101)])
+        table.del_row(long_row)
+        table.add_row(["much longer value"])
+        return table
+
+    def test_exact_by_default(self) -> None:
+        table = self.long_table(50)
+        assert "| much longer value |" in table.get_string()
+        assert table.width_overflow == 0
+
+    def test_wraps_unsampled_value(self) -> None:
+        table = PrettyTable(["Name"], width_estimate=10)
+        table.add_rows([["short"] for _ in range(50)])
+        table.add_row(["much longer value"])
+        table.add_rows([["short"] for _ in range(50)])
+        result = table.get_string()
+        assert table.width_overflow == 1
+        assert "| much  |\n| longe |" in result
+        table.width_estimate = None
+        assert "| much longer value |" in table.get_string()
+        assert table.width_overflow == 0
+
+    def test_first_and_last_rows_sampled(self) -> None:
+        table = PrettyTable(["Name"])
+        table.add_row(["first value"])
+        table.add_rows([["short"] for _ in range(100)])
+        table.add_row(["last value!!"])
+        result = table.get_string(width_estimate=3)
+        assert "| last value!! |" in result
+        assert table.width_overflow == 0
+
+    def test_small_table_is_exact(self) -> None:
+        table = self.long_table(50)
+        table.get_string(width_estimate=1000)
+        assert table.width_overflow == 0
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            PrettyTable(width_estimate=-1)
+
+
+class TestRenderLayout:
+    def test_reused(self, city_data_prettytable: PrettyTable) -> None:
+        first = city_data_prettytable.get_string()
+        layout = city_data_prettytable._layout
+        assert city_data_prettytable.get_string() == first
+        assert city_data_prettytable._layout is layout
+
+    def test_style_change(self, city_data_prettytable: PrettyTable) -> None:
+        city_data_prettytable.get_string()
+        city_data_prettytable.vertical_char = "!"
+        city_data_prettytable.align["City name"] = "l"
+        assert "! Adelaide  !" in city_data_prettytable.get_string()
+
+    def test_option_override(self, city_data_prettytable: PrettyTable) -> None:
+        city_data_prettytable.get_string()
+        result = city_data_prettytable.get_string(horizontal_char="=")
+        assert result.startswith("+===========+")
+        assert city_data_prettytable.get_string().startswith("+-----------+")
+
+    def test_width_change(self, city_data_prettytable: PrettyTable) -> None:
+        city_data_prettytable.get_string()
+        city_data_prettytable.add_row(["Alice Springs", 1, 23, 287.5])
+        assert city_data_prettytable.get_string().startswith("+---------------+")
+
 
 class TestClearing:
     def test_clear_rows(self, row_prettytable: PrettyTable) -> None:
@@ -2562,6 +4038,69 @@ class TestGeneralOutput:
         # Assert
         assert t.get_string() == t_copy.get_string()
 
+    @pytest.mark.parametrize("deep", [False, True])
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda table: table.add_row([10, "value 10", "value11", "value12"]),
+            lambda table: table.del_row(0),
+            lambda table: table.del_column("Field 2"),
+            lambda table: table.add_column("Field 5", [1, 2, 3]),
+            lambda table: table.min_width.update({"Field 1": 20}),
+            lambda table: table.custom_format.update({"Field 1": lambda f, v: "x"}),
+        ],
+    )
+    def test_copy_independent(
+        self, deep: bool, change: Callable[[PrettyTable], None]
+    ) -> None:
+        t = helper_table()
+        t.get_string()
+        t_copy = t.copy(deep=deep)
+        expected = t.get_string()
+
+        change(t_copy)
+        assert t.get_string() == expected
+        assert t_copy.get_string() != expected
+
+        t_copy = t.copy(deep=deep)
+        change(t)
+        assert t_copy.get_string() == expected
+
+    def test_copy_shares_rows(self) -> None:
+        t = helper_table()
+        t_copy = t.copy()
+        assert t_copy._rows is t._rows
+        assert t_copy._rows[0] is t._rows[0]
+        assert t.copy(deep=True)._rows[0] is not t._rows[0]
+
+    def test_copy_row_caches(self) -> None:
+        t = helper_table()
+        expected = t.get_string(sortby="Field 1", reversesort=True)
+        t_copy = t.copy()
+        # Worked out again when the copy is printed, rather than copied
+        assert len(t_copy._formatted_rows) == 0
+        assert len(t_copy._sort_keys) == 0
+        t_copy.del_row(0)
+        assert t.get_string(sortby="Field 1", reversesort=True) == expected
+        assert len(t._formatted_rows) == 3
+        assert t_copy.get_string(sortby="Field 1", reversesort=True) != expected
+
+    def test_copy_of_slice(self) -> None:
+        t = helper_table()
+        view = t[1:]
+        t_copy = view.copy(deep=True)
+        t.del_row(1)
+        assert t_copy.get_string() == view.get_string()
+        assert t_copy.rowcount == 2
+
+    def test_deep_copy_shares_executor(self) -> None:
+        t = helper_table()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            t.format_executor = executor
+            t_copy = t.copy(deep=True)
+            assert t_copy.format_executor is executor
+            assert t_copy.get_string() == t.get_string()
+
     def test_text(self) -> None:
         t = helper_table()
         assert t.get_formatted_string("text") == t.get_string()